@@ -1,40 +1,21 @@
+import os
+
 import streamlit as st
-import requests
-import urllib.parse
-import json
+
+from keyword_crawler import AUTOCOMPLETE_URL, SUFFIX_SETS, KeywordExpander
 
 # 페이지 설정
 st.set_page_config(page_title="쿠팡 키워드 소싱기", page_icon="🌳", layout="centered")
 
-def get_coupang_autocomplete(keyword):
-    # 쿠팡 자동완성 API (callback을 비워 순수 JSON으로 받음)
-    url = f"https://www.coupang.com/np/search/autoComplete?callback=&keyword={urllib.parse.quote(keyword)}"
-    
-    # 🌟 차단 방지를 위한 브라우저 헤더 완벽 위장 (가장 중요)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/javascript, */*; q=0.01",
-        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Referer": "https://www.coupang.com/",
-        "X-Requested-With": "XMLHttpRequest"
-    }
+# 세션/캐시를 재실행 사이에 공유 (캐시 파일은 HOONPRO_KEYWORD_CACHE, 테스트용 주소는 HOONPRO_AUTOCOMPLETE_URL로 조정)
+@st.cache_resource
+def get_expander():
+    return KeywordExpander(base_url=os.environ.get('HOONPRO_AUTOCOMPLETE_URL', AUTOCOMPLETE_URL),
+                           cache_path=os.environ.get('HOONPRO_KEYWORD_CACHE', 'keyword_cache.sqlite3'))
 
+def get_coupang_autocomplete(keyword):
     try:
-        # timeout을 설정하여 무한 대기 방지
-        response = requests.get(url, headers=headers, timeout=5)
-        response.raise_for_status() 
-        
-        # 텍스트 형태의 응답을 JSON으로 파싱
-        data = json.loads(response.text)
-        keywords = []
-        
-        # 자동완성 데이터 추출 로직
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict) and 'keyword' in item:
-                    keywords.append(item['keyword'])
-                    
-        return keywords
+        return get_expander().fetch(keyword)
     except Exception as e:
         st.error(f"데이터를 가져오는 중 오류가 발생했습니다. (IP가 일시적으로 차단되었을 수 있습니다) \n\n 에러: {e}")
         return []
@@ -60,4 +41,38 @@ if st.button("키워드 추출하기", type="primary"):
             else:
                 st.warning("추출된 키워드가 없거나 쿠팡 서버에서 응답을 거부했습니다.")
     else:
-        st.warning("키워드를 먼저 입력해주세요.")
\ No newline at end of file
+        st.warning("키워드를 먼저 입력해주세요.")
+
+# 확장 수집: 메인 키워드 + 접미어로 시작해서 나온 키워드를 다시 검색
+st.divider()
+st.subheader("🌲 키워드 확장 수집")
+st.caption("메인 키워드 뒤에 한글 음절/자음/알파벳을 붙여 검색하고, 나온 키워드를 다시 검색해 연관 키워드를 넓게 모읍니다.")
+
+c1, c2, c3 = st.columns(3)
+suffix_names = c1.multiselect("붙일 글자", list(SUFFIX_SETS), default=["한글 음절"])
+depth = c2.slider("확장 단계", min_value=1, max_value=3, value=2)
+max_keywords = c3.number_input("최대 키워드 수", min_value=50, max_value=5000, value=500, step=50)
+
+if st.button("확장 수집하기"):
+    if search_keyword.strip():
+        suffixes = [s for name in suffix_names for s in SUFFIX_SETS[name]]
+        expander = get_expander()
+        before = (expander.requests_made, expander.cache_hits)
+        with st.spinner('연관 키워드를 확장 수집 중입니다...'):
+            found, failed = expander.expand(search_keyword, depth=depth, suffixes=suffixes, max_keywords=max_keywords)
+
+        if found:
+            # pandas는 결과표를 만들 때만 import (첫 화면 로딩에는 불필요)
+            import pandas as pd
+
+            st.success(f"{len(found)}개의 키워드를 수집했습니다! (요청 {expander.requests_made - before[0]}회 · 캐시 적중 {expander.cache_hits - before[1]}회)")
+            result = pd.DataFrame(found)
+            st.dataframe(result, use_container_width=True)
+            st.download_button("키워드 목록 다운로드 (CSV)", data=result.to_csv(index=False).encode('utf-8-sig'),
+                               file_name=f"{search_keyword.strip()}_keywords.csv", mime='text/csv')
+        else:
+            st.warning("추출된 키워드가 없거나 쿠팡 서버에서 응답을 거부했습니다.")
+        if failed:
+            st.caption(f"⚠️ 실패한 검색어 {len(failed)}개: {', '.join(failed[:20])}")
+    else:
+        st.warning("키워드를 먼저 입력해주세요.")
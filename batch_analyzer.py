@@ -0,0 +1,186 @@
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+
+import pandas as pd
+
+from history_store import HistoryStore
+from keyword_index import build_index
+from report_cache import file_content_hash
+from report_engine import analyze_report, placement_metrics, product_metrics, report_totals, unit_margin, wasted_keywords
+from run_profile import RunProfile
+
+# -----------------------------------------------------------
+# 쿠팡 광고 보고서 일괄 분석기 (CLI, Streamlit 없이 실행)
+#   python batch_analyzer.py 보고서폴더/ "다른계정/*.xlsx" --out 결과폴더 --margins 마진.csv
+# 마진 파일 컬럼: sku, unit_price, unit_cost, delivery_fee, coupang_fee_rate
+#   - sku가 옵션명(광고집행 상품명)과 같으면 그 옵션의 순이익 계산에 사용
+#   - sku가 보고서 파일명(확장자 제외)과 같으면 그 보고서의 지면별/전체 지표에 사용
+#   - 빈 칸은 명령행 기본값 사용
+# --xlsx-engine / --xlsx-sidecar 는 report_io의 XLSX 엔진/Parquet 사이드카 설정
+# --history DB를 주면 각 보고서 합계를 기록 저장소에 추가 (보고서일 = 파일 수정일, 같은 파일은 1회만)
+# -----------------------------------------------------------
+MARGIN_FIELDS = ['unit_price', 'unit_cost', 'delivery_fee', 'coupang_fee_rate']
+REPORT_EXTENSIONS = ('.csv', '.xlsx')
+
+
+def find_reports(inputs):
+    # 폴더/글롭/파일 경로 → 중복 없는 보고서 파일 목록
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = [os.path.join(item, name) for name in sorted(os.listdir(item))]
+        else:
+            matches = sorted(glob.glob(item))
+        paths += [p for p in matches if p.lower().endswith(REPORT_EXTENSIONS) and os.path.isfile(p)]
+    return list(dict.fromkeys(paths))
+
+
+def load_margins(path):
+    # 마진 파일 → {sku: {필드: 값}} (빈 칸은 생략해서 기본값이 적용되게 함)
+    if not path:
+        return {}
+    if path.lower().endswith('.xlsx'):
+        table = pd.read_excel(path, engine='openpyxl')
+    else:
+        table = pd.read_csv(path, encoding='utf-8-sig')
+    table.columns = [str(c).strip() for c in table.columns]
+    if 'sku' not in table.columns:
+        raise ValueError(f"마진 파일에 'sku' 컬럼이 없습니다: {path}")
+    margins = {}
+    for row in table.to_dict('records'):
+        margins[str(row['sku']).strip()] = {f: float(row[f]) for f in MARGIN_FIELDS if f in row and pd.notna(row[f])}
+    return margins
+
+
+def output_names(paths):
+    # 보고서별 결과 파일 이름 (확장자 제외). 입력들의 공통 상위 폴더 기준 상대 경로를 그대로 따라감
+    #   a/rep.csv, b/rep.xlsx → a/rep, b/rep / 같은 폴더의 rep.csv, rep.xlsx → rep.csv, rep.xlsx
+    full = [os.path.abspath(p) for p in paths]
+    try:
+        base = os.path.commonpath([os.path.dirname(p) for p in full])
+        rel = [os.path.relpath(p, base) for p in full]
+    except ValueError:
+        # Windows에서 드라이브가 다른 경우
+        rel = [os.path.splitdrive(p)[1].lstrip(os.sep) for p in full]
+    names = [os.path.splitext(r)[0] for r in rel]
+    counts = pd.Series(names).value_counts()
+    return [r if counts[n] > 1 else n for r, n in zip(rel, names)]
+
+
+def write_table(df, out_dir, name, fmt):
+    path = os.path.join(out_dir, f"{name}.{fmt}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+def analyze_file(path, out_dir, fmt, defaults, margins, history=None, read_options=None, name=None):
+    # 작업 프로세스에서 실행: 보고서 1개 분석 후 결과표를 저장하고 요약 한 줄을 반환
+    # name: 결과 파일 이름 (output_names(), 없으면 파일명)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = name or stem
+    row = {'파일': path, '상태': 'ok', '오류': '', '결과파일': ''}
+    written = []
+    profile = RunProfile(path)
+    start = time.perf_counter()
+    try:
+        aggs = analyze_report(path, path, profile=profile, **(read_options or {}))
+        if aggs is None:
+            row['상태'] = 'skipped'
+            row['오류'] = "'광고 노출 지면' 또는 판매수량 컬럼이 없습니다."
+        else:
+            settings = {**defaults, **margins.get(stem, {})}
+            _, net_unit_margin = unit_margin(**settings)
+            written.append(write_table(placement_metrics(aggs.placement, settings['unit_price'], net_unit_margin), out_dir, f"{name}.summary", fmt))
+
+            if aggs.product is not None:
+                product_margin = aggs.product['상품명'].astype(str).map(
+                    lambda name: unit_margin(**{**settings, **margins.get(name, {})})[1])
+                written.append(write_table(product_metrics(aggs.product, product_margin), out_dir, f"{name}.options", fmt))
+
+            if aggs.keyword is not None:
+                written.append(write_table(wasted_keywords(aggs.keyword), out_dir, f"{name}.exclude_keywords", fmt))
+                written.append(write_table(build_index([aggs.keyword]).candidates(limit=None), out_dir, f"{name}.exclude_tokens", fmt))
+
+            row.update(report_totals(aggs.placement, settings['unit_price'], net_unit_margin))
+
+            if history:
+                report_date = date.fromtimestamp(os.path.getmtime(path))
+                row['기록저장'] = HistoryStore(history).add_report(file_content_hash(path), os.path.basename(path), report_date, aggs)
+    except Exception as e:
+        row['상태'] = 'error'
+        row['오류'] = f"{type(e).__name__}: {e}"
+    row['결과파일'] = '; '.join(written)
+    row['소요시간(초)'] = round(time.perf_counter() - start, 3)
+    # 읽기/정제/집계 단계별 소요시간 (decode(초), parse(초), ...)
+    row.update({f"{stage}(초)": seconds for stage, seconds in profile.stage_seconds().items()})
+    return row
+
+
+def run_batch(paths, out_dir, fmt='parquet', defaults=None, margins=None, workers=None, history=None, read_options=None):
+    # 보고서들을 프로세스 풀로 병렬 분석 → 파일별 요약/소요시간 DataFrame
+    os.makedirs(out_dir, exist_ok=True)
+    defaults = defaults or {'unit_price': 0, 'unit_cost': 0, 'delivery_fee': 3650, 'coupang_fee_rate': 11.55}
+    margins = margins or {}
+    workers = workers or os.cpu_count() or 1
+    names = output_names(paths)
+
+    if workers == 1 or len(paths) <= 1:
+        rows = [analyze_file(p, out_dir, fmt, defaults, margins, history, read_options, n) for p, n in zip(paths, names)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            futures = [pool.submit(analyze_file, p, out_dir, fmt, defaults, margins, history, read_options, n)
+                       for p, n in zip(paths, names)]
+            rows = [f.result() for f in as_completed(futures)]
+        order = {p: i for i, p in enumerate(paths)}
+        rows.sort(key=lambda r: order[r['파일']])
+
+    timing = pd.DataFrame(rows)
+    timing.to_csv(os.path.join(out_dir, 'timing.csv'), index=False, encoding='utf-8-sig')
+    return timing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿠팡 광고 보고서(CSV/XLSX) 일괄 분석기")
+    parser.add_argument('inputs', nargs='+', help="보고서 폴더, 파일 또는 글롭 패턴")
+    parser.add_argument('--out', default='analysis_output', help="결과 저장 폴더")
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet', help="결과 파일 형식")
+    parser.add_argument('--margins', help="SKU별 마진 설정 파일 (CSV/XLSX)")
+    parser.add_argument('--history', help="보고서 합계를 추가할 기록 저장소 (SQLite 파일)")
+    parser.add_argument('--xlsx-engine', choices=['auto', 'calamine', 'openpyxl'], default=None, help="XLSX 읽기 엔진 (기본: auto)")
+    parser.add_argument('--xlsx-sidecar', help="XLSX를 처음 읽을 때 Parquet 사본을 저장/재사용할 폴더")
+    parser.add_argument('--workers', type=int, default=None, help="동시에 실행할 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--unit-price', type=float, default=0, help="기본 상품 판매가 (원)")
+    parser.add_argument('--unit-cost', type=float, default=0, help="기본 최종원가 (원)")
+    parser.add_argument('--delivery-fee', type=float, default=3650, help="기본 로켓그로스 입출고비 (원)")
+    parser.add_argument('--fee-rate', type=float, default=11.55, help="기본 쿠팡 수수료 (%%)")
+    args = parser.parse_args(argv)
+
+    paths = find_reports(args.inputs)
+    if not paths:
+        print("분석할 보고서(CSV/XLSX)가 없습니다.", file=sys.stderr)
+        return 1
+
+    defaults = {'unit_price': args.unit_price, 'unit_cost': args.unit_cost,
+                'delivery_fee': args.delivery_fee, 'coupang_fee_rate': args.fee_rate}
+    read_options = {'xlsx_engine': args.xlsx_engine, 'sidecar_dir': args.xlsx_sidecar}
+    start = time.perf_counter()
+    timing = run_batch(paths, args.out, args.format, defaults, load_margins(args.margins), args.workers, args.history, read_options)
+    elapsed = time.perf_counter() - start
+
+    for row in timing.to_dict('records'):
+        print(f"[{row['상태']}] {row['파일']} ({row['소요시간(초)']:.2f}초) {row['오류']}".rstrip())
+    print(f"총 {len(paths)}개 보고서, {elapsed:.2f}초 → {args.out}")
+    return 0 if (timing['상태'] != 'error').all() else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
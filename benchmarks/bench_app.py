@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synth_report import write_report  # noqa: E402
+
+# -----------------------------------------------------------
+# 앱 첫 화면/상호작용 지연 측정 (Streamlit AppTest, 페이지마다 새 프로세스)
+#   python benchmarks/bench_app.py --repeat 5 --rows 20000
+#  - first_run: 새 프로세스에서 페이지 첫 실행 시간 (import 포함, 첫 화면 표시 시간의 근사)
+#  - 이후 값: 위젯 변경 1회당 재실행 시간
+#  - AppTest는 fragment 안의 위젯을 바꿔도 스크립트 전체를 다시 실행하므로 상호작용 값은 상한선
+#    (실제 서버에서는 표 페이지 이동/상품명 입력 등이 해당 fragment만 다시 실행)
+# -----------------------------------------------------------
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'requests']
+
+SCENARIO = r'''
+import json, os, sys, time
+os.chdir(ROOT); sys.path.insert(0, ROOT)
+from streamlit.testing.v1 import AppTest
+
+def timed(fn):
+    start = time.perf_counter(); fn(); return time.perf_counter() - start
+
+out = {}
+at = AppTest.from_file('app.py', default_timeout=120)
+if PAGE != 'pages/home.py':
+    at.switch_page(PAGE)
+out['first_run'] = timed(at.run)
+out['heavy_imports'] = [m for m in HEAVY_MODULES if m in sys.modules]
+
+if PAGE == 'pages/home.py':
+    out['navigate'] = timed(lambda: at.switch_page('pages/namer.py').run())
+elif PAGE == 'pages/namer.py':
+    out['type_keyword'] = timed(lambda: at.text_input[1].input('반팔티').run())
+    out['type_set_info'] = timed(lambda: at.text_input[4].input('1+1').run())
+elif PAGE == 'pages/analyzer.py':
+    with open(REPORT, 'rb') as f:
+        at.file_uploader[0].set_value((os.path.basename(REPORT), f.read(), 'text/csv'))
+    out['upload'] = timed(at.run)
+    out['change_margin'] = timed(lambda: at.sidebar.number_input[0].set_value(20000).run())
+    page_input = [n for n in at.number_input if n.key == 'winners_page'][0]
+    out['table_page'] = timed(lambda: page_input.set_value(2).run())
+print(json.dumps(out))
+'''
+
+PAGES = ['pages/home.py', 'pages/namer.py', 'pages/analyzer.py']
+
+
+def run_page(page, report):
+    code = f"ROOT = {ROOT!r}\nPAGE = {page!r}\nREPORT = {report!r}\nHEAVY_MODULES = {HEAVY_MODULES!r}\n" + SCENARIO
+    env = {**os.environ, 'HOONPRO_HISTORY_DB': os.path.join(os.path.dirname(report), 'bench_history.sqlite3'),
+           'HOONPRO_PROFILE_LOG': os.path.join(os.path.dirname(report), 'bench_profile.jsonl')}
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="앱 첫 화면/상호작용 지연 측정")
+    parser.add_argument('--repeat', type=int, default=3, help="페이지별 반복 횟수 (중앙값 출력)")
+    parser.add_argument('--rows', type=int, default=20_000, help="광고 분석기에 올릴 가상 보고서 행 수")
+    parser.add_argument('--data-dir', default='bench_data')
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    report = os.path.abspath(os.path.join(args.data_dir, f"report_{args.rows}_csv-utf8.csv"))
+    if not os.path.exists(report):
+        write_report(report, args.rows, 'csv-utf8')
+
+    for page in PAGES:
+        runs = [run_page(page, report) for _ in range(args.repeat)]
+        timings = {k: statistics.median(r[k] for r in runs) for k in runs[0] if k != 'heavy_imports'}
+        cells = "  ".join(f"{k} {v * 1000:,.0f}ms" for k, v in timings.items())
+        print(f"{page:<20} {cells}  무거운 모듈: {', '.join(runs[0]['heavy_imports']) or '없음'}")
+
+
+if __name__ == '__main__':
+    main()
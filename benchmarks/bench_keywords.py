@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_index import KeywordIndex  # noqa: E402
+from synth_report import generate_keyword_table  # noqa: E402
+
+# -----------------------------------------------------------
+# 단어별 제외 후보 색인 벤치마크
+#   python benchmarks/bench_keywords.py --keywords 1000000 --reports 4
+#  - 키워드 합계표를 보고서 --reports개로 나눠 차례로 add() (새 키워드 토큰화 + 증가분 반영)
+#  - 마지막에 이미 있는 키워드만 담긴 보고서 1개를 더함 (증가분만 반영하는 경로)
+# -----------------------------------------------------------
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="단어별 제외 후보 색인 벤치마크")
+    parser.add_argument('--keywords', type=int, default=1_000_000, help="서로 다른 키워드 수")
+    parser.add_argument('--reports', type=int, default=4, help="나눠서 더할 보고서 수")
+    parser.add_argument('--max-n', type=int, default=2, help="용어 최대 단어 수")
+    args = parser.parse_args(argv)
+
+    table, seconds = timed(lambda: generate_keyword_table(args.keywords))
+    print(f"키워드 {len(table):,}개 생성 {seconds:.2f}초")
+
+    index = KeywordIndex(args.max_n)
+    for i, part in enumerate(np.array_split(np.arange(len(table)), args.reports), 1):
+        _, seconds = timed(lambda: index.add(table.iloc[part]))
+        print(f"보고서 {i} 추가 ({len(part):,}개 새 키워드) {seconds:.2f}초")
+
+    repeat = table.sample(min(len(table), 100_000), random_state=0)
+    _, seconds = timed(lambda: index.add(repeat))
+    print(f"기존 키워드 {len(repeat):,}개 보고서 추가 {seconds:.2f}초")
+
+    found, seconds = timed(index.candidates)
+    print(f"제외 후보 {len(found):,}개 {seconds:.2f}초 · 용어 {len(index.term_keys):,}개 · 색인 {index.nbytes() / 1024 ** 2:,.0f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from report_engine import aggregate_report, combine_aggregates, placement_metrics, product_metrics, wasted_keywords  # noqa: E402
+from report_io import detect_encoding, is_csv, raw_csv_chunks, raw_xlsx_chunks, read_sample  # noqa: E402
+from report_schema import apply_schema  # noqa: E402
+from synth_report import FORMATS, write_report  # noqa: E402
+from table_view import style_page  # noqa: E402
+
+# -----------------------------------------------------------
+# 광고 분석 파이프라인 단계별 벤치마크 (읽기 → 정제 → 집계 → 화면 준비)
+#   python benchmarks/bench_pipeline.py --rows 10000 1000000 --formats csv-utf8 csv-cp949 xlsx --save-baseline
+#   python benchmarks/bench_pipeline.py --rows 10000 1000000 --formats csv-utf8 csv-cp949 xlsx
+#  - 단계별 소요시간, 전체 최대 RSS 출력
+#  - --memory: tracemalloc으로 단계별 최대 메모리도 측정 (추적 자체가 느려서 시간 측정과 따로 한 번 더 실행)
+#  - 저장된 기준값보다 tolerance 이상 느려진 단계가 있으면 표시하고 종료코드 1
+# -----------------------------------------------------------
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+STAGES = ['parse', 'clean', 'aggregate', 'render']
+# 이보다 짧은 단계는 측정 오차가 커서 회귀 판정에서 제외
+MIN_SECONDS = 0.05
+
+
+class StageTimer:
+    def __init__(self):
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.peak_bytes = dict.fromkeys(STAGES, 0)
+
+    @contextmanager
+    def __call__(self, stage):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+            if tracing:
+                self.peak_bytes[stage] = max(self.peak_bytes[stage], tracemalloc.get_traced_memory()[1] - base)
+
+
+def prepare_render(aggs, unit_price=20_000, net_unit_margin=5_000):
+    # run_analyzer()가 첫 화면에 그리는 것과 같은 양의 작업 (지표 계산, 정렬, 첫 페이지 Styler HTML)
+    summary = placement_metrics(aggs.placement, unit_price, net_unit_margin)
+    style_page(summary, profit_cols=['실질순이익']).to_html()
+    if aggs.product is not None:
+        prod_agg = product_metrics(aggs.product, net_unit_margin)
+        style_page(prod_agg[prod_agg['판매수량'] > 0].sort_values('판매수량', ascending=False)).to_html()
+    if aggs.keyword is not None:
+        ", ".join(wasted_keywords(aggs.keyword)['키워드'].head(300).astype(str).tolist())
+
+
+def run_case(path, timer):
+    with timer('parse'):
+        if is_csv(path):
+            col_qty, chunks = raw_csv_chunks(path, detect_encoding(read_sample(path)))
+        else:
+            col_qty, chunks = raw_xlsx_chunks(path)
+        chunks = iter(chunks)
+
+    total = None
+    rows = 0
+    while True:
+        with timer('parse'):
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        rows += len(chunk)
+        with timer('clean'):
+            chunk = apply_schema(chunk, col_qty)
+        with timer('aggregate'):
+            part = aggregate_report(chunk, col_qty)
+            total = part if total is None else combine_aggregates(total, part)
+
+    with timer('render'):
+        prepare_render(total)
+
+    return rows
+
+
+def measure(path, memory=False):
+    timer = StageTimer()
+    rows = run_case(path, timer)
+    result = {
+        'rows': rows,
+        'seconds': {k: round(v, 4) for k, v in timer.seconds.items()},
+        'total_seconds': round(sum(timer.seconds.values()), 4),
+    }
+    if memory:
+        timer = StageTimer()
+        tracemalloc.start()
+        try:
+            run_case(path, timer)
+        finally:
+            tracemalloc.stop()
+        result['peak_mb'] = {k: round(v / 1024 ** 2, 1) for k, v in timer.peak_bytes.items()}
+    return result
+
+
+def find_regressions(result, base, tolerance):
+    flagged = []
+    for stage in STAGES:
+        now, before = result['seconds'][stage], base['seconds'].get(stage)
+        if before is not None and now > MIN_SECONDS and now > before * (1 + tolerance):
+            flagged.append(f"{stage} {before:.3f}s → {now:.3f}s (+{(now / max(before, 1e-9) - 1):.0%})")
+    return flagged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="광고 분석 파이프라인 단계별 벤치마크")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--formats', nargs='+', choices=list(FORMATS), default=['csv-utf8'])
+    parser.add_argument('--data-dir', default='bench_data', help="가상 보고서 저장 폴더 (있으면 재사용)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 기준값으로 저장")
+    parser.add_argument('--memory', action='store_true', help="단계별 최대 메모리도 측정 (tracemalloc)")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="허용 속도 저하 비율 (기본 25%%)")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    results, regressions = {}, {}
+    for rows in args.rows:
+        for fmt in args.formats:
+            kind, _ = FORMATS[fmt]
+            path = os.path.join(args.data_dir, f"report_{rows}_{fmt}.{kind}")
+            if not os.path.exists(path):
+                write_report(path, rows, fmt)
+            case = f"{fmt}-{rows}"
+            result = results[case] = measure(path, args.memory)
+
+            peak = result.get('peak_mb')
+            stages = "  ".join(f"{s} {result['seconds'][s]:.3f}s" + (f"/{peak[s]:.0f}MB" if peak else '') for s in STAGES)
+            print(f"{case:<22} {stages}  합계 {result['total_seconds']:.3f}s")
+            if case in baseline and not args.save_baseline:
+                flagged = find_regressions(result, baseline[case], args.tolerance)
+                if flagged:
+                    regressions[case] = flagged
+                    print(f"  ⚠️ 회귀: {'; '.join(flagged)}")
+    if resource is not None:
+        print(f"최대 RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f}MB")
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from report_engine import aggregate_report, analyze_report  # noqa: E402
+from report_io import available_xlsx_engines, iter_xlsx_chunks, load_report  # noqa: E402
+from synth_report import write_report  # noqa: E402
+
+# -----------------------------------------------------------
+# XLSX 읽기 엔진 비교 벤치마크
+#   python benchmarks/bench_xlsx.py 보고서.xlsx
+#   python benchmarks/bench_xlsx.py --rows 100000   (임시 보고서 생성 후 측정)
+# -----------------------------------------------------------
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="XLSX 읽기 엔진 비교")
+    parser.add_argument('path', nargs='?', help="측정할 XLSX 보고서 (없으면 --rows 크기로 생성)")
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path
+        if not path:
+            path = os.path.join(tmp, 'bench.xlsx')
+            write_report(path, args.rows, 'xlsx')
+        data = open(path, 'rb').read()
+        print(f"{path} ({len(data) / 1024 ** 2:,.1f}MB)")
+
+        cases = {'pd.read_excel(openpyxl) 전체 읽기': lambda: aggregate_report(*load_report(path, data))}
+        for engine in available_xlsx_engines():
+            cases[f"{engine} 스트리밍"] = lambda engine=engine: analyze_report(path, data, xlsx_engine=engine)
+
+        sidecar_dir = os.path.join(tmp, 'sidecar')
+        # 사이드카는 청크를 끝까지 읽어야 저장됨
+        for _ in iter_xlsx_chunks(data, sidecar_dir=sidecar_dir)[1]:
+            pass
+        cases['Parquet 사이드카 재사용'] = lambda: analyze_report(path, data, sidecar_dir=sidecar_dir)
+
+        baseline = None
+        for name, fn in cases.items():
+            seconds = best_of(fn, args.repeat)
+            baseline = baseline or seconds
+            print(f"{name:<36} {seconds:8.3f}초  x{baseline / seconds:5.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from report_schema import QTY_TARGETS  # noqa: E402
+
+# -----------------------------------------------------------
+# 쿠팡 광고 보고서 가상 데이터 생성기 (벤치마크용)
+#   python benchmarks/synth_report.py --rows 1000000 --formats csv-utf8 csv-cp949 xlsx --out bench_data
+#  - 실제 컬럼명, 천단위 쉼표, '-' 표기, 롱테일 키워드/옵션 분포를 흉내냄
+#  - CSV는 청크 단위로 이어 써서 1,000만 행도 메모리 부담 없이 생성
+# -----------------------------------------------------------
+PLACEMENTS = ['검색 영역', '비검색 영역', '리타겟팅']
+PLACEMENT_WEIGHTS = [0.6, 0.3, 0.1]
+
+BRANDS = ['훈프로', '쇼크트리', '로지텍', '로지텍', '로지택', '삼성', '애플', '샤오미']
+MODIFIERS = ['무선', '유선', '게이밍', '저소음', '블루투스', '무료배송', '무료', '사무용', '가성비', '미니', '대용량', '휴대용', '1+1', '세트']
+PRODUCTS = ['마우스', '키보드', '마우스패드', '충전기', '케이블', '거치대', '이어폰', '스피커', '허브', '보조배터리']
+COLORS = ['블랙', '화이트', '그레이', '핑크', '네이비']
+
+XLSX_MAX_ROWS = 1_048_575
+FORMATS = {'csv-utf8': ('csv', 'utf-8-sig'), 'csv-cp949': ('csv', 'cp949'), 'xlsx': ('xlsx', None)}
+
+
+def _vocabulary(rng, size, parts):
+    # 단어 조합(+ 절반은 모델번호)으로 size개의 서로 다른 문자열 생성, 마지막 part는 항상 포함
+    words = pd.Index([], dtype=object)
+    while len(words) < size:
+        n = size * 2
+        cols = [np.where((rng.random(n) < 0.8) | (i == len(parts) - 1), rng.choice(p, n), '') for i, p in enumerate(parts)]
+        cols.append(np.where(rng.random(n) < 0.5, rng.integers(1, 1000, n).astype(str), ''))
+        joined = [' '.join(dict.fromkeys(w for w in ws if w)) for ws in zip(*cols)]
+        words = words.append(pd.Index(joined)).unique()
+    return np.array(sorted(words[:size]))
+
+
+def _zipf_index(rng, n, size, a=1.2):
+    # 소수의 인기 항목에 몰리고 긴 꼬리가 있는 분포
+    return np.minimum(rng.zipf(a, n) - 1, size - 1)
+
+
+def _commas(values):
+    return pd.Series(values).map('{:,}'.format)
+
+
+def _dashes(rng, values, rate):
+    # 0 값 일부를 '-'로 표기 (쿠팡 보고서 형식)
+    text = _commas(values)
+    text[(values == 0) & (rng.random(len(values)) < rate)] = '-'
+    return text
+
+
+def generate_chunks(rows, seed=0, qty_column=QTY_TARGETS[0], n_products=2_000, n_keywords=50_000, dash_rate=0.7,
+                    chunk_rows=500_000):
+    # 같은 seed면 같은 보고서. 옵션/키워드 목록은 전체 청크가 공유
+    rng = np.random.default_rng(seed)
+    products = _vocabulary(rng, n_products, [BRANDS, MODIFIERS, PRODUCTS, COLORS])
+    keywords = _vocabulary(rng, n_keywords, [BRANDS, MODIFIERS, MODIFIERS, PRODUCTS])
+    for start in range(0, rows, chunk_rows):
+        yield _generate_chunk(rng, min(chunk_rows, rows - start), products, keywords, qty_column, dash_rate)
+
+
+def generate_report(rows, **kwargs):
+    return pd.concat(list(generate_chunks(rows, **kwargs)), ignore_index=True)
+
+
+def generate_keyword_table(n_keywords, seed=0):
+    # 키워드별 합계표 (report_engine.KEYWORD_COLUMNS) n_keywords행. 키워드 단위 벤치마크용
+    rng = np.random.default_rng(seed)
+    keywords = _vocabulary(rng, n_keywords, [BRANDS, MODIFIERS, MODIFIERS, PRODUCTS])
+    clicks = rng.poisson(3, n_keywords)
+    qty = rng.binomial(clicks, 0.03)
+    return pd.DataFrame({'키워드': keywords, '광고비': (clicks * rng.integers(100, 1_500, n_keywords)).astype(float),
+                         '판매수량': qty.astype(float), '클릭수': clicks.astype(float)})
+
+
+def _generate_chunk(rng, rows, products, keywords, qty_column, dash_rate):
+    impressions = rng.integers(0, 30_000, rows) * (rng.random(rows) < 0.9)
+    clicks = np.minimum(impressions, rng.poisson(impressions * 0.005))
+    spend = clicks * rng.integers(100, 1_500, rows)
+    qty = np.minimum(clicks, rng.binomial(clicks, 0.03))
+    return pd.DataFrame({
+        '광고 노출 지면': rng.choice(PLACEMENTS, rows, p=PLACEMENT_WEIGHTS),
+        '캠페인명': rng.choice(['매출 최적화', '수동 성과형', '신상품 테스트'], rows),
+        '광고그룹': rng.choice(['그룹 A', '그룹 B', '그룹 C', '그룹 D'], rows),
+        '광고집행 상품명': products[_zipf_index(rng, rows, len(products))],
+        '키워드': keywords[_zipf_index(rng, rows, len(keywords), a=1.05)],
+        '노출수': _commas(impressions),
+        '클릭수': _dashes(rng, clicks, dash_rate),
+        '광고비': _dashes(rng, spend, dash_rate),
+        qty_column: _dashes(rng, qty, dash_rate),
+    })
+
+
+def write_report(path, rows, fmt='csv-utf8', **kwargs):
+    # fmt: csv-utf8 / csv-cp949 / xlsx (kwargs는 generate_chunks() 인자)
+    kind, encoding = FORMATS[fmt]
+    chunks = generate_chunks(rows, **kwargs)
+    if kind == 'xlsx':
+        if rows > XLSX_MAX_ROWS:
+            raise ValueError(f"XLSX는 최대 {XLSX_MAX_ROWS:,}행까지 만들 수 있습니다 (요청: {rows:,}행)")
+        _write_xlsx(path, chunks)
+        return path
+
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=False, header=i == 0)
+    return path
+
+
+def _write_xlsx(path, chunks):
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            ws.append(list(chunk.columns))
+        for row in chunk.itertuples(index=False):
+            ws.append(list(row))
+    wb.save(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿠팡 광고 보고서 가상 데이터 생성")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000])
+    parser.add_argument('--formats', nargs='+', choices=list(FORMATS), default=['csv-utf8'])
+    parser.add_argument('--qty-column', choices=QTY_TARGETS, default=QTY_TARGETS[0])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='bench_data')
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    for rows in args.rows:
+        for fmt in args.formats:
+            kind, _ = FORMATS[fmt]
+            path = os.path.join(args.out, f"report_{rows}_{fmt}.{kind}")
+            write_report(path, rows, fmt, seed=args.seed, qty_column=args.qty_column)
+            print(f"{path} ({os.path.getsize(path) / 1024 ** 2:,.1f}MB)")
+
+
+if __name__ == '__main__':
+    main()
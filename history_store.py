@@ -0,0 +1,145 @@
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import pandas as pd
+
+# -----------------------------------------------------------
+# 보고서 기록 저장소 (SQLite, 보고서당 지면/옵션/키워드 합계만 저장)
+#  - 같은 파일(내용 해시)은 한 번만 저장
+#  - 추이/누적 조회는 인덱스를 타는 SQL 집계로 처리 (원본 재파싱 없음)
+# -----------------------------------------------------------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    file_hash TEXT NOT NULL UNIQUE,
+    file_name TEXT NOT NULL,
+    report_date TEXT NOT NULL,
+    added_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_date ON reports (report_date, id);
+
+CREATE TABLE IF NOT EXISTS placement_stats (
+    report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+    placement TEXT NOT NULL,
+    impressions REAL, clicks REAL, spend REAL, quantity REAL,
+    PRIMARY KEY (report_id, placement)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_placement_stats_key ON placement_stats (placement, report_id);
+
+CREATE TABLE IF NOT EXISTS product_stats (
+    report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+    product TEXT NOT NULL,
+    impressions REAL, clicks REAL, spend REAL, quantity REAL,
+    PRIMARY KEY (report_id, product)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_product_stats_key ON product_stats (product, report_id);
+
+CREATE TABLE IF NOT EXISTS keyword_stats (
+    report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+    keyword TEXT NOT NULL,
+    spend REAL, quantity REAL, clicks REAL,
+    PRIMARY KEY (report_id, keyword)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_keyword_stats_key ON keyword_stats (keyword, report_id);
+"""
+
+# 예전 DB에 없는 컬럼 (테이블, 컬럼, 타입). 예전 보고서 행은 NULL
+_ADDED_COLUMNS = [('keyword_stats', 'clicks', 'REAL')]
+
+# 최근 N개 보고서 id (N이 None이면 전체)
+_RECENT = "SELECT id FROM reports ORDER BY report_date DESC, id DESC LIMIT ?"
+
+
+def _migrate(conn):
+    for table, column, kind in _ADDED_COLUMNS:
+        if column not in [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+
+
+class HistoryStore:
+    def __init__(self, path):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+            _migrate(conn)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _query(self, sql, params=()):
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def add_report(self, file_hash, file_name, report_date, aggs):
+        # ReportAggregates 저장 → 새로 저장했으면 True, 이미 있는 파일이면 False
+        with closing(self._connect()) as conn, conn:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO reports (file_hash, file_name, report_date, added_at) VALUES (?, ?, ?, ?)",
+                (file_hash, file_name, str(report_date), datetime.now().isoformat(timespec='seconds')))
+            if cur.rowcount == 0:
+                return False
+            report_id = cur.lastrowid
+
+            p = aggs.placement
+            conn.executemany(
+                "INSERT INTO placement_stats VALUES (?, ?, ?, ?, ?, ?)",
+                zip([report_id] * len(p), p['지면'].astype(str), p['노출수'].astype(float), p['클릭수'].astype(float),
+                    p['광고비'].astype(float), p['판매수량'].astype(float)))
+            if aggs.product is not None:
+                p = aggs.product
+                conn.executemany(
+                    "INSERT INTO product_stats VALUES (?, ?, ?, ?, ?, ?)",
+                    zip([report_id] * len(p), p['상품명'].astype(str), p['노출수'].astype(float), p['클릭수'].astype(float),
+                        p['광고비'].astype(float), p['판매수량'].astype(float)))
+            if aggs.keyword is not None:
+                k = aggs.keyword
+                conn.executemany(
+                    "INSERT INTO keyword_stats (report_id, keyword, spend, quantity, clicks) VALUES (?, ?, ?, ?, ?)",
+                    zip([report_id] * len(k), k['키워드'].astype(str), k['광고비'].astype(float), k['판매수량'].astype(float),
+                        k['클릭수'].astype(float)))
+            return True
+
+    def has_report(self, file_hash):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM reports WHERE file_hash = ?", (file_hash,)).fetchone() is not None
+
+    def reports(self):
+        return self._query("SELECT id, file_name AS 파일, report_date AS 보고서일, added_at AS 저장일시 "
+                           "FROM reports ORDER BY report_date, id")
+
+    def delete_report(self, report_id):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM reports WHERE id = ?", (report_id,))
+
+    def placement_trend(self, last_n=None):
+        # 보고서일 × 지면별 합계 (placement_metrics()에 그대로 넣을 수 있는 컬럼명)
+        return self._query(
+            "SELECT r.report_date AS 보고서일, s.placement AS 지면, SUM(s.impressions) AS 노출수, SUM(s.clicks) AS 클릭수, "
+            "SUM(s.spend) AS 광고비, SUM(s.quantity) AS 판매수량 "
+            f"FROM placement_stats s JOIN reports r ON r.id = s.report_id WHERE r.id IN ({_RECENT}) "
+            "GROUP BY r.report_date, s.placement ORDER BY r.report_date, s.placement",
+            (-1 if last_n is None else last_n,))
+
+    def keyword_trend(self, keyword, last_n=None):
+        return self._query(
+            "SELECT r.report_date AS 보고서일, SUM(s.spend) AS 광고비, SUM(s.quantity) AS 판매수량 "
+            f"FROM keyword_stats s JOIN reports r ON r.id = s.report_id WHERE s.keyword = ? AND r.id IN ({_RECENT}) "
+            "GROUP BY r.report_date ORDER BY r.report_date",
+            (keyword, -1 if last_n is None else last_n))
+
+    def wasted_keywords(self, last_n=None, limit=None):
+        # 최근 N개 보고서 동안 판매 0 + 광고비 발생 키워드 (누적 광고비 내림차순)
+        return self._query(
+            "SELECT s.keyword AS 키워드, SUM(s.spend) AS 광고비, SUM(s.quantity) AS 판매수량, COUNT(*) AS 보고서수 "
+            f"FROM keyword_stats s WHERE s.report_id IN ({_RECENT}) "
+            "GROUP BY s.keyword HAVING SUM(s.quantity) = 0 AND SUM(s.spend) > 0 ORDER BY 광고비 DESC LIMIT ?",
+            (-1 if last_n is None else last_n, -1 if limit is None else limit))
+
+    def keyword_stats(self, report_id):
+        # 보고서 1개의 키워드 합계표 (KEYWORD_COLUMNS 순서, 클릭수 없이 저장된 예전 보고서는 0)
+        return self._query(
+            "SELECT keyword AS 키워드, spend AS 광고비, quantity AS 판매수량, COALESCE(clicks, 0) AS 클릭수 "
+            "FROM keyword_stats WHERE report_id = ?", (report_id,))
@@ -0,0 +1,188 @@
+import json
+import sqlite3
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+# -----------------------------------------------------------
+# 쿠팡 자동완성 키워드 확장 수집기 (Streamlit 비의존)
+#  - keep-alive 세션 1개를 스레드들이 공유, 동시 요청 수/초당 요청 수 제한
+#  - 실패 시 지수 백오프 재시도, 응답은 SQLite 파일에 TTL 캐시
+#  - base_url만 바꾸면 로컬 스텁 서버로 테스트 가능
+#  - requests는 KeywordExpander를 만들 때 import (상수/파서만 쓰는 화면은 로딩 비용 없음)
+# -----------------------------------------------------------
+AUTOCOMPLETE_URL = "https://www.coupang.com/np/search/autoComplete"
+
+# 차단 방지를 위한 브라우저 헤더
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://www.coupang.com/",
+    "X-Requested-With": "XMLHttpRequest"
+}
+
+HANGUL_SYLLABLES = list("가나다라마바사아자차카타파하")
+HANGUL_JAMO = list("ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎ")
+ALPHABET = list("abcdefghijklmnopqrstuvwxyz")
+SUFFIX_SETS = {'한글 음절': HANGUL_SYLLABLES, '자음': HANGUL_JAMO, '알파벳': ALPHABET}
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def parse_autocomplete(text):
+    # 자동완성 응답(JSON 리스트)에서 키워드만 추출
+    data = json.loads(text)
+    keywords = []
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and 'keyword' in item:
+                keywords.append(item['keyword'])
+    return keywords
+
+
+class TokenBucket:
+    # 초당 rate개, 최대 burst개까지 몰아서 허용
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ResponseCache:
+    # 검색어 → 키워드 목록, ttl초가 지나면 만료
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS autocomplete ("
+                         "query TEXT PRIMARY KEY, keywords TEXT NOT NULL, fetched_at REAL NOT NULL)")
+
+    def get(self, query):
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            row = conn.execute("SELECT keywords, fetched_at FROM autocomplete WHERE query = ?", (query,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, query, keywords):
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO autocomplete VALUES (?, ?, ?)",
+                         (query, json.dumps(keywords, ensure_ascii=False), time.time()))
+
+    def purge(self):
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute("DELETE FROM autocomplete WHERE fetched_at < ?", (time.time() - self.ttl,))
+
+
+class KeywordExpander:
+    def __init__(self, base_url=AUTOCOMPLETE_URL, cache_path=None, ttl=24 * 3600, max_workers=8,
+                 rate=5.0, retries=3, backoff=0.5, timeout=5):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.base_url = base_url
+        self.cache = ResponseCache(cache_path, ttl) if cache_path else None
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # 풀 스레드들이 함께 올리는 카운터
+        self.requests_made = 0
+        self.cache_hits = 0
+        self._count_lock = threading.Lock()
+
+    def _count(self, name):
+        with self._count_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _url(self, query):
+        # callback을 비워 순수 JSON으로 받음
+        return f"{self.base_url}?callback=&keyword={urllib.parse.quote(query)}"
+
+    def fetch(self, query):
+        # 검색어 1개의 자동완성 키워드 (캐시 → 네트워크, 재시도 후에도 실패하면 예외)
+        if self.cache is not None:
+            cached = self.cache.get(query)
+            if cached is not None:
+                self._count('cache_hits')
+                return cached
+
+        requests = self._requests
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            self._count('requests_made')
+            try:
+                response = self.session.get(self._url(query), timeout=self.timeout)
+                if response.status_code in RETRY_STATUS and attempt < self.retries:
+                    raise requests.HTTPError(f"{response.status_code} 응답", response=response)
+                response.raise_for_status()
+                keywords = parse_autocomplete(response.text)
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                retryable = e.response is None or e.response.status_code in RETRY_STATUS
+                if attempt >= self.retries or not retryable:
+                    raise
+                time.sleep(self.backoff * (2 ** attempt))
+
+        if self.cache is not None:
+            self.cache.put(query, keywords)
+        return keywords
+
+    def expand(self, seed, depth=2, suffixes=HANGUL_SYLLABLES, max_keywords=1000):
+        # seed와 seed+접미어들로 시작해서, 새로 나온 키워드를 depth단계까지 다시 검색
+        # 반환: [{'키워드', '단계', '검색어'}] (발견 순서, 중복 제거, seed 제외), 실패한 검색어 목록
+        seed = seed.strip()
+        found = {}
+        failed = []
+        queried = set()
+        frontier = [seed] + [f"{seed} {s}" for s in suffixes]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for level in range(1, depth + 1):
+                queries = [q for q in dict.fromkeys(frontier) if q not in queried]
+                queried.update(queries)
+                futures = [(q, pool.submit(self.fetch, q)) for q in queries]
+                next_frontier = []
+                for query, future in futures:
+                    if len(found) >= max_keywords:
+                        # 다 모았으면 아직 시작 안 한 요청은 취소 (실행 중인 것만 기다림)
+                        future.cancel()
+                        continue
+                    try:
+                        keywords = future.result()
+                    except (self._requests.RequestException, ValueError):
+                        failed.append(query)
+                        continue
+                    for kw in keywords:
+                        if kw != seed and kw not in found and len(found) < max_keywords:
+                            found[kw] = {'키워드': kw, '단계': level, '검색어': query}
+                            next_frontier.append(kw)
+                if len(found) >= max_keywords:
+                    break
+                frontier = next_frontier
+
+        return list(found.values()), failed
@@ -0,0 +1,247 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------------------------------------
+# 키워드 토큰 역색인 + 낭비 광고비 귀속 (Streamlit 비의존)
+#  - 키워드 정규화: NFKC, 소문자, 한글/영문 경계 분리('로지텍mx' → '로지텍 mx'), 기호 제거('1+1'의 +는 유지)
+#  - 용어(term) = 단어 + 이어진 단어 묶음(기본 2단어까지). 키워드의 광고비/클릭수/판매수량을 포함된 용어마다 그대로 더함
+#  - 키워드 → 용어 목록은 CSR(indptr/postings) 배열, 용어 합계는 np.bincount로 한 번에 계산
+#  - add()로 보고서를 계속 더할 수 있음 (새 키워드만 토큰화, 기존 키워드는 증가분만 반영)
+# -----------------------------------------------------------
+METRICS = ['광고비', '클릭수', '판매수량']
+# 용어별 합계 배열의 열: 광고비, 클릭수, 판매수량, 판매0광고비(누적 판매 0인 키워드의 광고비)
+TERM_METRICS = METRICS + ['판매0광고비']
+
+_SCRIPT_BOUNDARY = r'(?<=[가-힣])(?=[a-z])|(?<=[a-z])(?=[가-힣])'
+_SEPARATORS = r'[^\w+]+'
+
+
+def normalize_keywords(keywords):
+    # 키워드 Series → 정규화된 키워드 Series (단어는 공백 1칸으로 구분)
+    s = keywords.astype(str).str.normalize('NFKC').str.lower()
+    s = s.str.replace(_SCRIPT_BOUNDARY, ' ', regex=True)
+    return s.str.replace(_SEPARATORS, ' ', regex=True).str.strip()
+
+
+# n단어 용어 키: 단어 번호를 (키 * TOKEN_SPACE + 번호 + 1)로 접음 → 단어 수가 달라도 겹치지 않음, 3단어까지 int64
+# 단어 번호 + 1이 TOKEN_SPACE 이상이면 키가 겹치므로 단어 수는 TOKEN_SPACE - 1개까지 (넘으면 ValueError)
+TOKEN_SPACE = 2 ** 21
+MAX_N = 3
+
+
+def _ngram_keys(owner, token_ids, max_n):
+    # (키워드 번호, 단어 번호) 배열 → (키워드 번호, 용어 키) 배열. owner는 키워드별로 연속이어야 함
+    owners, keys = [owner], [token_ids + 1]
+    for n in range(2, max_n + 1):
+        if len(token_ids) < n:
+            break
+        size = len(token_ids) - n + 1
+        same = owner[n - 1:] == owner[:size]
+        key = np.zeros(same.sum(), dtype=np.int64)
+        for i in range(n):
+            key = key * TOKEN_SPACE + token_ids[i:i + size][same] + 1
+        owners.append(owner[:size][same])
+        keys.append(key)
+    return np.concatenate(owners), np.concatenate(keys)
+
+
+def _key_parts(keys):
+    # 용어 키 → 단어 자리별 (번호 + 1) 배열 목록, 앞 단어부터. 빈 자리는 0
+    keys = np.asarray(keys, dtype=np.int64)
+    parts = []
+    while (keys > 0).any():
+        parts.append(keys % TOKEN_SPACE)
+        keys = keys // TOKEN_SPACE
+    return parts[::-1]
+
+
+def _word_counts(parts):
+    return sum((part > 0).astype(int) for part in parts)
+
+
+def _decode_keys(keys, tokens):
+    # 용어 키 → 용어 문자열 ('무료 배송')
+    vocab = tokens.to_numpy()
+    text = pd.Series('', index=range(len(keys)), dtype=object)
+    for part in _key_parts(keys):
+        text = text + ' ' + pd.Series(np.where(part > 0, vocab[np.maximum(part - 1, 0)], ''), dtype=object)
+    # 짧은 용어는 앞쪽 빈 자리 때문에 공백이 붙음
+    return text.str.strip().to_numpy()
+
+
+def _gather(indptr, ids):
+    # CSR에서 ids 행들의 위치 (행 순서대로 이어붙임)와 행별 길이
+    starts = indptr[ids]
+    lengths = indptr[ids + 1] - starts
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return offsets + np.arange(lengths.sum()), lengths
+
+
+class KeywordIndex:
+    def __init__(self, max_n=2):
+        if not 1 <= max_n <= MAX_N:
+            raise ValueError(f"max_n은 1~{MAX_N} 사이여야 합니다: {max_n}")
+        self.max_n = max_n
+        # 키워드(원래 표기) / 정규화 단어 / 용어 키 (문자열은 결과표를 만들 때만 풀어씀)
+        self.keywords = pd.Index([], dtype=object)
+        self.keyword_metrics = np.zeros((0, len(METRICS)))
+        self.tokens = pd.Index([], dtype=object)
+        self.term_keys = pd.Index([], dtype=np.int64)
+        self.term_metrics = np.zeros((0, len(TERM_METRICS)))
+        self.term_keywords = np.zeros(0, dtype=np.int64)
+        # 키워드 i의 용어 번호 = postings[indptr[i]:indptr[i + 1]]
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.postings = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def nbytes(self):
+        arrays = (self.keyword_metrics, self.indptr, self.postings, self.term_metrics, self.term_keywords)
+        indexes = (self.keywords, self.tokens, self.term_keys)
+        return int(sum(a.nbytes for a in arrays) + sum(i.memory_usage(deep=True) for i in indexes))
+
+    def add(self, keyword_table):
+        # 키워드별 합계표(키워드, 광고비, 판매수량[, 클릭수]) 1개를 더함
+        values = np.column_stack([
+            keyword_table[c].to_numpy(dtype=float) if c in keyword_table.columns else np.zeros(len(keyword_table))
+            for c in METRICS])
+        group, names = pd.factorize(keyword_table['키워드'].astype(str))
+        if not len(names):
+            return self
+        delta = np.column_stack([np.bincount(group, weights=values[:, j], minlength=len(names)) for j in range(len(METRICS))])
+
+        ids = self.keywords.get_indexer(names)
+        new = ids < 0
+        if new.any():
+            ids[new] = np.arange(len(self.keywords), len(self.keywords) + new.sum())
+            self._add_keywords(np.asarray(names)[new])
+
+        qty_col, spend_col = METRICS.index('판매수량'), METRICS.index('광고비')
+        before = self.keyword_metrics[ids]
+        after = before + delta
+        self.keyword_metrics[ids] = after
+        wasted = np.where(after[:, qty_col] == 0, after[:, spend_col], 0) - np.where(before[:, qty_col] == 0, before[:, spend_col], 0)
+
+        # 바뀐 키워드의 증가분을 그 키워드에 속한 용어들에 한 번에 더함
+        positions, lengths = _gather(self.indptr, ids)
+        term_ids = self.postings[positions]
+        weights = np.column_stack([delta, wasted])
+        for j in range(weights.shape[1]):
+            self.term_metrics[:, j] += np.bincount(term_ids, weights=np.repeat(weights[:, j], lengths), minlength=len(self.term_keys))
+        return self
+
+    def _token_ids(self, names):
+        # 키워드 → (키워드 위치, 정규화 단어 번호) 배열. 정규화는 고유한 공백 단위 조각에만 적용
+        pieces = pd.Series(names, dtype=object).str.split().explode().dropna()
+        piece_codes, piece_vocab = pd.factorize(pieces)
+        # 조각 하나가 정규화 후 여러 단어가 되거나('로지텍mx') 없어질 수 있음('!!')
+        split = normalize_keywords(pd.Series(piece_vocab, dtype=object)).str.split().explode().dropna()
+        split = split[split != '']
+        piece_indptr = np.concatenate([[0], np.cumsum(np.bincount(split.index.to_numpy(dtype=np.int64), minlength=len(piece_vocab)))])
+
+        known = self.tokens.get_indexer(split)
+        unseen = known < 0
+        if unseen.any():
+            codes, fresh = pd.factorize(split.to_numpy()[unseen])
+            if len(self.tokens) + len(fresh) >= TOKEN_SPACE:
+                # 색인은 아직 바뀌지 않은 상태 (새 단어를 붙이기 전에 확인)
+                raise ValueError(f"단어 종류가 너무 많습니다: {len(self.tokens) + len(fresh):,}개 (최대 {TOKEN_SPACE - 1:,}개)")
+            known[unseen] = codes + len(self.tokens)
+            self.tokens = self.tokens.append(pd.Index(fresh, dtype=object))
+
+        positions, lengths = _gather(piece_indptr, piece_codes)
+        return np.repeat(pieces.index.to_numpy(dtype=np.int64), lengths), known[positions].astype(np.int64)
+
+    def _add_keywords(self, names):
+        # 새 키워드만 토큰화해서 CSR 뒤에 이어붙임 (키워드 번호는 기존 개수부터)
+        owner, token_ids = self._token_ids(names)
+        owner, keys = _ngram_keys(owner, token_ids, self.max_n)
+
+        term_ids = self.term_keys.get_indexer(keys)
+        unseen = term_ids < 0
+        if unseen.any():
+            codes, fresh = pd.factorize(keys[unseen])
+            term_ids[unseen] = codes + len(self.term_keys)
+            self.term_keys = self.term_keys.append(pd.Index(fresh, dtype=np.int64))
+            self.term_metrics = np.vstack([self.term_metrics, np.zeros((len(fresh), len(TERM_METRICS)))])
+            self.term_keywords = np.concatenate([self.term_keywords, np.zeros(len(fresh), dtype=np.int64)])
+
+        # 키워드 안에서 같은 용어는 한 번만, 키워드 순서로 정렬 (용어 번호 < 2^31)
+        pairs = np.sort(owner * 2 ** 31 + term_ids)
+        # 기호만 있는 키워드('-')뿐이면 pairs가 비어 있음 → 용어 0개인 키워드로 등록
+        pairs = pairs[np.diff(pairs, prepend=-1) != 0]
+        owner, term_ids = pairs // 2 ** 31, pairs % 2 ** 31
+
+        counts = np.bincount(owner, minlength=len(names))
+        self.indptr = np.concatenate([self.indptr, self.indptr[-1] + np.cumsum(counts)])
+        self.postings = np.concatenate([self.postings, term_ids])
+        self.term_keywords += np.bincount(term_ids, minlength=len(self.term_keys))
+
+        self.keywords = self.keywords.append(pd.Index(names, dtype=object))
+        self.keyword_metrics = np.vstack([self.keyword_metrics, np.zeros((len(names), len(METRICS)))])
+
+    def term_stats(self, term_ids=None):
+        # 용어별 합계표 (용어, 단어수, 키워드수, 광고비, 클릭수, 판매수량, 판매0광고비). term_ids가 없으면 전체
+        if term_ids is None:
+            term_ids = np.arange(len(self.term_keys))
+        keys = self.term_keys.to_numpy()[term_ids]
+        stats = pd.DataFrame(self.term_metrics[term_ids], columns=TERM_METRICS, index=term_ids)
+        stats.insert(0, '키워드수', self.term_keywords[term_ids])
+        stats.insert(0, '단어수', _word_counts(_key_parts(keys)))
+        stats.insert(0, '용어', _decode_keys(keys, self.tokens))
+        return stats
+
+    def candidates(self, min_keywords=2, max_sales=0, min_spend=1, limit=200, examples=3):
+        # 제외 키워드 후보: 여러 키워드에 걸쳐 광고비를 쓰고 판매는 max_sales 이하인 용어 (판매0광고비 내림차순)
+        m = self.term_metrics
+        spend, qty, wasted = (m[:, TERM_METRICS.index(c)] for c in ('광고비', '판매수량', '판매0광고비'))
+        found = np.flatnonzero((self.term_keywords >= min_keywords) & (qty <= max_sales) & (spend >= min_spend))
+        found = self._drop_redundant_phrases(found)
+        found = found[np.lexsort((-spend[found], -wasted[found]))]
+        if limit:
+            found = found[:limit]
+        stats = self.term_stats(found)
+        stats['예시키워드'] = self._examples(found, examples)
+        return stats.reset_index(drop=True)
+
+    def _drop_redundant_phrases(self, found):
+        # 묶음 용어가 구성 단어 하나와 키워드수/광고비가 같으면 (그 단어가 항상 그 묶음으로만 쓰임) 단어 쪽만 남김
+        if not len(found):
+            return found
+        spend = self.term_metrics[:, TERM_METRICS.index('광고비')]
+        redundant = np.zeros(len(found), dtype=bool)
+        parts = _key_parts(self.term_keys.to_numpy()[found])
+        is_phrase = _word_counts(parts) > 1
+        for part in parts:
+            # 단어 1개 용어의 키 = 단어 번호 + 1
+            word_ids = self.term_keys.get_indexer(part)
+            ok = is_phrase & (part > 0) & (word_ids >= 0)
+            same = np.zeros(len(found), dtype=bool)
+            same[ok] = ((self.term_keywords[word_ids[ok]] == self.term_keywords[found[ok]])
+                        & np.isclose(spend[word_ids[ok]], spend[found[ok]]))
+            redundant |= same
+        return found[~redundant]
+
+    def _examples(self, term_ids, n):
+        # 용어별 광고비 상위 n개 원래 키워드 (', ' 연결)
+        if not len(term_ids) or not n:
+            return [''] * len(term_ids)
+        owner = np.repeat(np.arange(len(self.keywords)), np.diff(self.indptr))
+        mask = np.isin(self.postings, term_ids)
+        hits = pd.DataFrame({
+            'term': self.postings[mask],
+            'spend': self.keyword_metrics[owner[mask], METRICS.index('광고비')],
+            'keyword': self.keywords.to_numpy()[owner[mask]],
+        }).sort_values(['term', 'spend'], ascending=[True, False])
+        top = hits.groupby('term').head(n).groupby('term')['keyword'].agg(', '.join)
+        return top.reindex(term_ids, fill_value='').to_numpy()
+
+
+def build_index(keyword_tables, max_n=2):
+    # 키워드 합계표 여러 개(보고서 순서대로)로 색인 생성
+    index = KeywordIndex(max_n)
+    for table in keyword_tables:
+        if table is not None:
+            index.add(table)
+    return index
@@ -0,0 +1,299 @@
+import os
+import threading
+from datetime import date
+
+import streamlit as st
+
+from history_store import HistoryStore
+from keyword_index import KeywordIndex, build_index
+from report_cache import ReportCache, content_hash
+from report_engine import analyze_report, placement_metrics, product_metrics, report_totals, unit_margin, wasted_keywords
+from run_profile import RunProfile, configure_logging
+from table_view import download_csv, lazy_section, paged_table
+
+# 보고서 캐시 (프로세스 공용, 한도는 HOONPRO_REPORT_CACHE_MB 환경변수로 조정)
+@st.cache_resource
+def get_report_cache():
+    return ReportCache(max_bytes=int(os.environ.get('HOONPRO_REPORT_CACHE_MB', '512')) * 1024 * 1024)
+
+# 보고서별 단어 색인 캐시 (보고서 캐시 적중/미스 통계와 분리, 한도는 HOONPRO_TOKEN_CACHE_MB)
+@st.cache_resource
+def get_token_cache():
+    return ReportCache(max_bytes=int(os.environ.get('HOONPRO_TOKEN_CACHE_MB', '256')) * 1024 * 1024)
+
+# 보고서 기록 저장소 (경로는 HOONPRO_HISTORY_DB 환경변수로 조정)
+@st.cache_resource
+def get_history_store():
+    return HistoryStore(os.environ.get('HOONPRO_HISTORY_DB', 'hoonpro_history.sqlite3'))
+
+# 분석 1회마다 JSON 한 줄 로그 (HOONPRO_PROFILE_LOG 파일, 없으면 stderr)
+@st.cache_resource
+def get_profile_logger():
+    return configure_logging(os.environ.get('HOONPRO_PROFILE_LOG'))
+
+# 기록 전체의 단어 색인 (새로 저장된 보고서만 더하고, 삭제된 보고서가 있으면 다시 만듦)
+@st.cache_resource
+def get_history_index():
+    return {'report_ids': set(), 'index': KeywordIndex(), 'lock': threading.Lock()}
+
+# 제외 키워드 입력창에 미리 보여줄 개수 (전체 목록은 다운로드)
+KEYWORD_PREVIEW = 300
+TOKEN_FORMATS = {'광고비': '{:,.0f}원', '클릭수': '{:,.0f}', '판매수량': '{:,.0f}', '판매0광고비': '{:,.0f}원'}
+
+# -----------------------------------------------------------
+# [기능 1] 쿠팡 광고 성과 분석기 (기존 코드 유지)
+# -----------------------------------------------------------
+# 저장 버튼/기간 슬라이더는 이 영역만 다시 실행
+@st.fragment
+def show_history(file_hash, file_name, aggs, unit_price, net_unit_margin):
+    st.divider(); st.subheader("🗂️ 기간별 추이 (보고서 기록)")
+    store = get_history_store()
+
+    if store.has_report(file_hash):
+        st.caption("✅ 이 보고서는 이미 기록에 저장되어 있습니다.")
+    else:
+        h1, h2 = st.columns(2)
+        report_date = h1.date_input("보고서 기준일", value=date.today())
+        if h2.button("이 보고서를 기록에 저장", use_container_width=True):
+            store.add_report(file_hash, file_name, report_date, aggs)
+            st.success("기록에 저장했습니다.")
+
+    n_reports = len(store.reports())
+    if n_reports < 2:
+        st.info("보고서를 2개 이상 저장하면 지면별 ROAS 추이와 누적 제외 키워드가 표시됩니다.")
+        return
+
+    last_n = st.slider("최근 보고서 수", min_value=2, max_value=n_reports, value=min(n_reports, 8)) if n_reports > 2 else 2
+    trend = store.placement_trend(last_n)
+    trend['실제ROAS'] = (trend['판매수량'] * unit_price / trend['광고비']).fillna(0)
+    st.markdown("##### 📈 지면별 실제 ROAS 추이")
+    st.line_chart(trend.pivot_table(index='보고서일', columns='지면', values='실제ROAS'))
+
+    st.markdown(f"##### 💸 최근 {last_n}개 보고서 누적 판매0 키워드")
+    wasted = store.wasted_keywords(last_n, limit=200)
+    paged_table(wasted, key="history_wasted", formats={'광고비': '{:,.0f}원', '판매수량': '{:,.0f}'})
+
+    st.markdown("##### 🧩 전체 기록 누적 단어별 낭비 광고비")
+    if lazy_section("누적 단어별 제외 후보 보기", key="history_tokens_open"):
+        try:
+            paged_table(history_token_candidates(store, min_keywords=2), key="history_tokens", formats=TOKEN_FORMATS)
+        except ValueError as e:
+            st.warning(f"누적 단어 색인을 더 늘릴 수 없습니다: {e}")
+
+def history_token_candidates(store, min_keywords):
+    state = get_history_index()
+    with state['lock']:
+        report_ids = set(store.reports()['id'])
+        if not state['report_ids'] <= report_ids:
+            state['report_ids'], state['index'] = set(), KeywordIndex()
+        for report_id in sorted(report_ids - state['report_ids']):
+            state['index'].add(store.keyword_stats(report_id))
+            state['report_ids'].add(report_id)
+        return state['index'].candidates(min_keywords=min_keywords)
+
+@st.fragment
+def show_token_candidates(file_hash, keyword):
+    # 키워드를 단어/2단어 묶음으로 쪼개 판매 0인 광고비를 모음 (색인은 보고서당 1회 생성 후 캐시)
+    st.markdown("##### 🧩 단어별 낭비 광고비")
+    if not lazy_section("단어별 제외 후보 보기", key="tokens_open"):
+        return
+    cache = get_token_cache()
+    index = cache.get(file_hash)
+    if index is None:
+        index = build_index([keyword])
+        cache.put(file_hash, index)
+    min_keywords = st.number_input("최소 포함 키워드 수", min_value=1, value=2, step=1, key="tokens_min_keywords")
+    found = index.candidates(min_keywords=min_keywords)
+    st.caption(f"키워드 {len(index):,}개 기준 · 판매 없는 단어 상위 {len(found):,}개 (판매0광고비 순). 예시키워드를 확인한 뒤 제외 등록하세요.")
+    paged_table(found, key="tokens", formats=TOKEN_FORMATS)
+    download_csv(found, "단어별 제외 후보 다운로드 (CSV)", "exclude_tokens.csv", key="tokens_csv")
+
+@st.fragment
+def show_losers(losers):
+    # 목록 열기/페이지 이동은 이 영역만 다시 실행
+    st.markdown("##### 💸 돈만 쓰는 옵션 (판매0)")
+    st.caption(f"{len(losers):,}개 옵션 · 광고비 합계 {losers['광고비'].sum():,.0f}원")
+    if lazy_section("목록 보기", key="losers_open"):
+        paged_table(losers.sort_values('광고비', ascending=False), key="losers")
+
+def request_capture():
+    st.session_state.profile_capture = True
+
+def show_profile_panel(profile):
+    # 사이드바 성능 진단: 단계별 시간/행·열 수/메모리, 이벤트, 오류, 1회 정밀 측정
+    info = profile.to_dict()
+    with st.sidebar.expander("🛠️ 성능 진단", expanded=True):
+        rss = f" · 최대 RSS {info['max_rss_mb']:,.0f}MB" if info['max_rss_mb'] is not None else ""
+        st.caption(f"run {info['run_id']} · 총 {info['total_seconds']:.3f}초{rss}")
+        st.dataframe([{'단계': name, **stat} for name, stat in info['stages'].items()], use_container_width=True, hide_index=True)
+        if info['events']:
+            st.json(info['events'], expanded=False)
+        if info['error']:
+            st.code(info['error']['traceback'], language="text")
+        st.button("다음 실행 1회 정밀 측정 (cProfile/tracemalloc)", on_click=request_capture, use_container_width=True)
+
+    if profile.report:
+        st.session_state.profile_report = profile.report
+    if st.session_state.get('profile_report'):
+        with st.sidebar.expander("🔬 정밀 측정 결과", expanded=profile.capture):
+            st.download_button("결과 다운로드 (TXT)", st.session_state.profile_report.encode('utf-8'), file_name="profile.txt", mime="text/plain")
+            st.code(st.session_state.profile_report, language="text")
+
+def run_analyzer():
+    st.title("📊 쇼크트리 훈프로 쿠팡 광고 성과 분석기")
+    st.markdown("쿠팡 보고서(CSV 또는 XLSX)를 업로드하면 훈프로의 정밀 운영 전략이 자동으로 생성됩니다.")
+
+    # --- 사이드바: 수익성 계산 설정 ---
+    st.sidebar.header("💰 마진 계산 설정")
+    unit_price = st.sidebar.number_input("상품 판매가 (원)", min_value=0, value=0, step=100)
+    unit_cost = st.sidebar.number_input("최종원가(매입가 등) (원)", min_value=0, value=0, step=100)
+
+    delivery_fee = st.sidebar.number_input("로켓그로스 입출고비 (원)", min_value=0, value=3650, step=10)
+    coupang_fee_rate = st.sidebar.number_input("쿠팡 수수료(vat포함) (%)", min_value=0.0, max_value=100.0, value=11.55, step=0.1)
+
+    total_fee_amount, net_unit_margin = unit_margin(unit_price, unit_cost, delivery_fee, coupang_fee_rate)
+
+    st.sidebar.divider()
+    st.sidebar.write(f"**📦 입출고비 합계:** {delivery_fee:,.0f}원")
+    st.sidebar.write(f"**📊 예상 수수료 ({coupang_fee_rate}%):** {total_fee_amount:,.0f}원")
+    st.sidebar.write(f"**💡 개당 예상 마진:** :green[{net_unit_margin:,.0f}원]") 
+
+    if unit_price > 0:
+        margin_rate = (net_unit_margin / unit_price) * 100
+        st.sidebar.write(f"**📈 예상 마진율:** {margin_rate:.1f}%")
+
+    st.sidebar.divider()
+    debug = st.sidebar.toggle("🛠️ 성능 진단 패널", value=False, key="debug_profile")
+
+    uploaded_file = st.file_uploader("보고서 파일을 선택하세요 (CSV 또는 XLSX)", type=['csv', 'xlsx'])
+
+    if uploaded_file is not None:
+        get_profile_logger()
+        # 정밀 측정은 요청 직후 1회만 (보고서 캐시를 건너뛰고 다시 분석)
+        profile = RunProfile(uploaded_file.name, capture=st.session_state.pop('profile_capture', False))
+        profile.start_capture()
+        try:
+            cache = get_report_cache()
+            # 업로드 내용 해시는 실행마다 1번만 계산해서 캐시/기록/단어 색인에 같이 사용
+            file_hash = content_hash(uploaded_file.getvalue())
+            # 가격과 무관한 합계는 보고서당 1회만 계산 → 마진 변경 시 집계표 위에서 지표만 재계산
+            if profile.capture:
+                aggs = analyze_report(uploaded_file.name, uploaded_file.getvalue(), profile=profile)
+                cache.put(file_hash, aggs)
+            else:
+                aggs = cache.get_or_load(uploaded_file.getvalue(), lambda data: analyze_report(uploaded_file.name, data, profile=profile), key=file_hash)
+            profile.event('report_cache', hit='parse' not in profile.stages)
+            stats = cache.stats()
+            st.sidebar.caption(f"🗂️ 보고서 캐시: 적중 {stats['hits']} / 미스 {stats['misses']} · {stats['entries']}개 · {stats['bytes'] / 1024 ** 2:,.1f}MB")
+
+            if aggs is not None:
+                with profile.stage('metrics'):
+                    summary = placement_metrics(aggs.placement, unit_price, net_unit_margin)
+                    total_data = report_totals(aggs.placement, unit_price, net_unit_margin)
+                total_real_roas = total_data['실제ROAS']
+                total_profit = total_data['실질순이익']
+                
+                st.subheader("📌 핵심 성과 지표")
+                m1, m2, m3, m4 = st.columns(4)
+                p_color = "#FF4B4B" if total_profit >= 0 else "#1C83E1"
+                
+                cols = [m1, m2, m3, m4]
+                vals = [("최종 실질 순이익", f"{total_profit:,.0f}원", p_color), 
+                        ("총 광고비", f"{total_data['광고비']:,.0f}원", "#31333F"), 
+                        ("실제 ROAS", f"{total_real_roas:.2%}", "#31333F"), 
+                        ("총 판매수량", f"{total_data['판매수량']:,.0f}개", "#31333F")]
+                
+                for c, (l, v, clr) in zip(cols, vals):
+                    c.markdown(f"<div style='background-color:#f0f2f6;padding:15px;border-radius:10px;text-align:center;'> <p style='margin:0;font-size:14px;'>{l}</p><h2 style='margin:0;color:{clr};'>{v}</h2></div>", unsafe_allow_html=True)
+
+                st.write(""); st.subheader("📍 지면별 상세 분석")
+                paged_table(summary, key="summary", profit_cols=['실질순이익'],
+                            formats={'노출수': '{:,.0f}', '클릭수': '{:,.0f}', '광고비': '{:,.0f}원', '판매수량': '{:,.0f}', '실제매출액': '{:,.0f}원', 'CPC': '{:,.0f}원', '클릭률(CTR)': '{:.2%}', '구매전환율(CVR)': '{:.2%}', '실제ROAS': '{:.2%}', '실질순이익': '{:,.0f}원'})
+
+                if aggs.product is not None:
+                    st.divider(); st.subheader("🛍️ 옵션별 성과 분석")
+                    with profile.stage('metrics'):
+                        prod_agg = product_metrics(aggs.product, net_unit_margin)
+                        winners = prod_agg[prod_agg['판매수량']>0].sort_values('판매수량', ascending=False)
+                    
+                    st.markdown("##### 🏆 효자 옵션 (판매순)")
+                    paged_table(winners, key="winners", formats={'광고비': '{:,.0f}원', '판매수량': '{:,.0f}개', '실질순이익': '{:,.0f}원'})
+
+                    show_losers(prod_agg[(prod_agg['판매수량']==0) & (prod_agg['광고비']>0)])
+                    download_csv(prod_agg, "옵션별 전체 성과 다운로드 (CSV)", "options.csv", key="options_csv")
+
+                if aggs.keyword is not None:
+                    st.divider(); st.subheader("✂️ 제외 키워드 제안")
+                    with profile.stage('metrics'):
+                        bad_kws = wasted_keywords(aggs.keyword)
+                    if len(bad_kws) > KEYWORD_PREVIEW:
+                        st.caption(f"광고비 상위 {KEYWORD_PREVIEW}개만 표시합니다. 전체 {len(bad_kws):,}개는 아래에서 다운로드하세요.")
+                    st.text_area("복사해서 제외 등록하세요:", ", ".join(bad_kws['키워드'].head(KEYWORD_PREVIEW).astype(str).tolist()))
+                    download_csv(bad_kws, "제외 키워드 전체 다운로드 (CSV)", "exclude_keywords.csv", key="bad_kws_csv")
+                    show_token_candidates(file_hash, aggs.keyword)
+
+                st.divider()
+                st.subheader("💡 훈프로의 정밀 운영 제안")
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.info("🖼️ **클릭률(CTR) 분석 (썸네일)**")
+                    ctr_val = total_data['클릭률(CTR)']
+                    st.write(f"- **현재 CTR: {ctr_val:.2%}**")
+                    if ctr_val < 0.01:
+                        st.write("- **상태**: 고객의 눈길을 전혀 끌지 못하고 있습니다.")
+                        st.write("- **액션**: 썸네일 배경 제거, 텍스트 강조, 혹은 주력 이미지 교체가 시급합니다.")
+                    else:
+                        st.write("- **상태**: 시각적 매력이 충분합니다. 클릭률을 유지하며 공격적인 노출을 시도하세요.")
+
+                with col2:
+                    st.warning("🛒 **구매전환율(CVR) 분석 (상세페이지)**")
+                    cvr_val = total_data['구매전환율(CVR)']
+                    st.write(f"- **현재 CVR: {cvr_val:.2%}**")
+                    if cvr_val < 0.05:
+                        st.write("- **상태**: 유입은 되나 설득력이 부족해 구매로 이어지지 않습니다.")
+                        st.write("- **액션**: 상단에 '무료배송', '이벤트' 등 혜택을 강조하고 구매평 관리에 집중하세요.")
+                    else:
+                        st.write("- **상태**: 상세페이지 전환 능력이 탁월합니다. 유입 단가(CPC) 관리에 힘쓰세요.")
+
+                with col3:
+                    st.error("💰 **목표수익률 최적화 가이드**")
+                    st.write(f"- **현재 실제 ROAS: {total_real_roas:.2%}**")
+                    
+                    if total_real_roas < 2.0:
+                        st.write("🔴 **[200% 미만] 절대 손실 구간**")
+                        st.write("- **액션**: 광고를 새로만드시거나 대대적인 수정이 시급합니다. 목표수익률을 최소 200%p 이상 상향하세요.")
+                    elif 2.0 <= total_real_roas < 3.0:
+                        st.write("🟠 **[200%~300%] 적자 지속 구간**")
+                        st.write("- **액션**: 역마진이 심각합니다. 목표수익률 상향과 고비용 키워드 차단이 필요합니다.")
+                    elif 3.0 <= total_real_roas < 4.0:
+                        st.write("🟡 **[300%~400%] 손익분기점 안착 구간**")
+                        st.write("- **액션**: 수익이 나기 시작합니다. 효율 낮은 키워드를 솎아내며 목표수익률을 50%p 상향하세요.")
+                    elif 4.0 <= total_real_roas < 5.0:
+                        st.write("🟢 **[400%~500%] 안정적 수익 구간**")
+                        st.write("- **전략**: 황금 밸런스입니다. 현재를 유지하며 매출 확대를 위해 목표수익률을 미세 조정하세요.")
+                    elif 5.0 <= total_real_roas < 6.0:
+                        st.write("🔵 **[500%~600%] 시장 점유 확장 단계**")
+                        st.write("- **전략**: 수익이 넉넉합니다. 목표수익률을 하향 조정한 후 노출량을 극대화하세요.")
+                    else:
+                        st.write("🚀 **[600% 이상] 시장 지배 구간**")
+                        st.write("- **전략**: 과감한 하향 조정을 통해 매출 규모 자체를 키우세요.")
+
+                show_history(file_hash, uploaded_file.name, aggs, unit_price, net_unit_margin)
+
+        except Exception as e:
+            # 화면에는 요약만, 전체 traceback은 JSON 로그와 성능 진단 패널에
+            profile.fail(e)
+            st.error(f"데이터 처리 중 오류 발생: {type(e).__name__}: {e}")
+            if "openpyxl" in str(e):
+                st.error("💡 해결방법: 터미널(또는 CMD)에 'pip install openpyxl'을 입력하여 설치해 주세요.")
+        finally:
+            profile.stop_capture()
+            profile.finish()
+            profile.remainder('render')
+            profile.log()
+
+        if debug:
+            show_profile_panel(profile)
+
+run_analyzer()
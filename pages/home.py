@@ -0,0 +1,22 @@
+import streamlit as st
+
+# -----------------------------------------------------------
+# [기능 3] 홈 화면
+# -----------------------------------------------------------
+def run_home():
+    st.title("🚀 쇼크트리 훈프로 통합 솔루션")
+    st.markdown("### 쿠팡 셀러를 위한 데이터 기반 성장 도구")
+    st.divider()
+    
+    c1, c2 = st.columns(2)
+    with c1:
+        st.info("📊 **광고 성과 분석기**")
+        st.write("ROAS 50% 단위 세분화 분석 및 키워드 제외 제안")
+        # 페이지 링크: 클릭 한 번에 이동 (재실행 1회)
+        st.page_link("pages/analyzer.py", label="광고 분석기 바로가기", use_container_width=True)
+    with c2:
+        st.success("🏷️ **상품명 제조기**")
+        st.write("클릭을 부르는 최적의 상품명 조합기")
+        st.page_link("pages/namer.py", label="상품명 제조기 바로가기", use_container_width=True)
+
+run_home()
@@ -0,0 +1,122 @@
+import streamlit as st
+
+from table_view import download_csv, paged_table
+from title_maker import MAX_TITLE_LENGTH, TITLE_COLUMNS, catalog_template_csv, clean_join, duplicate_tokens
+
+# -----------------------------------------------------------
+# [기능 2] 쿠팡 상품명 제조기 (요청하신 코드로 교체됨)
+# -----------------------------------------------------------
+def run_namer():
+    st.title("🏷️ 쇼크트리 훈프로 쿠팡 상품명 제조기")
+    st.markdown("입력값이 수정되면 상품명이 **실시간으로 자동 변경**됩니다.")
+    st.divider()
+
+    title_builder()
+    run_namer_batch()
+
+# 입력값을 바꾸면 이 영역만 다시 실행 (대량 모드 영역은 그대로)
+@st.fragment
+def title_builder():
+    # --- 입력 섹션 ---
+    st.subheader("1. 상품 정보 입력")
+
+    col1, col2 = st.columns(2)
+
+    # 왼쪽 컬럼: 기본 정보
+    with col1:
+        brand = st.text_input("브랜드 (없으면 공란)", placeholder="예: 나이키, 훈프로")
+        # [요청반영] 타겟 '남자'로 변경
+        target = st.selectbox("타겟 (성별/대상)", ["", "남자", "여성", "남녀공용", "아동", "유아", "키즈", "성인"])
+        season = st.multiselect("시즌 (여러개 선택 가능)", ["봄", "여름", "가을", "겨울", "간절기", "사계절"], default=[])
+
+    # 오른쪽 컬럼: 상품 상세 (순서 변경됨)
+    with col2:
+        # [요청반영] 순서: 제품명1 -> 소구점 -> 제품명2 -> 구성
+        main_keyword = st.text_input("제품명 1 (핵심 키워드) *필수", placeholder="예: 반팔티, 원피스")
+        appeal_point = st.text_input("소구점 (특징/재질/핏)", placeholder="예: 오버핏, 린넨, 구김없는")
+        sub_keyword = st.text_input("제품명 2 (세부 키워드)", placeholder="예: 라운드티, 롱원피스")
+        set_info = st.text_input("구성 (몇종/세트)", placeholder="예: 3종 세트, 1+1")
+
+    # --- 생성 로직 ---
+    # 시즌 리스트를 문자열로 변환
+    season_str = " ".join(season)
+
+    # [최종 공식] 브랜드 + 타겟 + 시즌 + 제품명 1 + 소구점 + 제품명 2 + 구성
+    # 입력값 변경 시 즉시 재계산됨
+    final_title = clean_join([brand, target, season_str, main_keyword, appeal_point, sub_keyword, set_info])
+
+    # --- 결과 출력 섹션 ---
+    st.divider()
+    st.subheader("2. 생성된 상품명 확인")
+
+    if main_keyword:
+        st.markdown("##### ✅ 최종 상품명")
+        st.caption("공식: 브랜드 + 타겟 + 시즌 + 제품명1 + 소구점 + 제품명2 + 구성")
+        
+        # [핵심] st.code를 사용하여 실시간 업데이트 + 복사 기능 제공
+        st.code(final_title, language="text")
+        
+        # 글자수 확인
+        text_len = len(final_title)
+        st.caption(f"📏 글자수: {text_len}자 (공백 포함)")
+
+        # --- 유효성 검사 ---
+        st.markdown("---")
+        st.subheader("🔍 훈프로의 상품명 진단")
+        
+        # 1. 글자수 체크
+        if text_len > MAX_TITLE_LENGTH:
+            st.warning(f"⚠️ **길이 주의 ({text_len}자):** {MAX_TITLE_LENGTH}자를 넘으면 모바일 목록에서 뒷부분이 잘릴 수 있습니다.")
+        else:
+            st.success(f"✅ **길이 적합 ({text_len}자):** 모바일 가독성이 좋은 길이입니다.")
+
+        # 2. 중복 단어 체크 (띄어쓰기/대소문자/기호만 다른 단어도 중복으로 봄)
+        duplicates = duplicate_tokens(final_title)
+        if duplicates:
+            st.error(f"🚫 **중복 단어 발견:** '{', '.join(duplicates)}' 단어가 중복되었습니다. 쿠팡 어뷰징 방지를 위해 하나를 삭제해주세요.")
+        else:
+            st.success("✅ **중복 없음:** 깔끔한 키워드 조합입니다.")
+
+    else:
+        st.info("👆 위 칸에 '제품명 1'을 입력하고 엔터를 치세요.")
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def diagnose_upload(file_name, data):
+    # pandas는 대량 모드에서 파일을 올렸을 때만 import
+    from title_batch import diagnose_catalog, read_catalog
+    return diagnose_catalog(read_catalog(file_name, data))
+
+@st.fragment
+def run_namer_batch():
+    # 상품 목록 파일로 상품명을 한 번에 만들고 진단 결과를 파일로 내려받기
+    st.divider()
+    st.subheader("3. 대량 상품명 만들기 (CSV/엑셀)")
+    st.caption(f"컬럼: {', '.join(TITLE_COLUMNS)} (제품명1 필수, 나머지는 없거나 비워도 됨)")
+    st.download_button("📄 양식 다운로드", data=catalog_template_csv(), file_name="상품명_양식.csv", mime='text/csv', key='title_template')
+
+    catalog_file = st.file_uploader("상품 목록 업로드", type=['csv', 'xlsx'], key='title_catalog')
+    if not catalog_file:
+        return
+
+    try:
+        result = diagnose_upload(catalog_file.name, catalog_file.getvalue())
+    except (ValueError, UnicodeDecodeError) as e:
+        st.error(f"파일을 읽을 수 없습니다: {e}")
+        return
+    if '제품명1' not in result.columns:
+        st.error("'제품명1' 컬럼이 없습니다. 양식을 내려받아 컬럼명을 맞춰주세요.")
+        return
+
+    too_long = int(result['길이초과'].sum())
+    has_dup = int((result['중복단어'] != '').sum())
+    m1, m2, m3 = st.columns(3)
+    m1.metric("상품 수", f"{len(result):,}개")
+    m2.metric(f"{MAX_TITLE_LENGTH}자 초과", f"{too_long:,}개")
+    m3.metric("중복 단어", f"{has_dup:,}개")
+
+    only_issues = st.toggle("문제 있는 상품만 보기", value=False, key='title_issues')
+    view = result[result['길이초과'] | (result['중복단어'] != '')] if only_issues else result
+    paged_table(view[['상품명', '글자수', '길이초과', '중복단어']], key='title_batch')
+    download_csv(result, "📥 상품명 결과 다운로드 (CSV)", "상품명_결과.csv", key='title_result')
+
+run_namer()
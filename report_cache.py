@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+# -----------------------------------------------------------
+# 업로드 파일 내용 해시 기반 보고서 캐시 (LRU + 메모리 한도)
+# -----------------------------------------------------------
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_content_hash(path, block_size=1024 * 1024):
+    # content_hash()와 같은 값을 파일 전체를 메모리에 올리지 않고 계산
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+_MISSING = object()
+
+
+def frame_nbytes(df):
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def value_nbytes(value):
+    # 캐시 값은 nbytes()를 제공하면 그 크기로 계산 (None 등은 0)
+    nbytes = getattr(value, 'nbytes', None)
+    return int(nbytes()) if callable(nbytes) else 0
+
+
+class ReportCache:
+    # 키: 파일 내용 해시 / 값: 보고서 분석 결과 (예: report_engine.ReportAggregates)
+    # 총 메모리가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 제거
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value):
+        size = value_nbytes(value)
+        with self._lock:
+            if key in self._items:
+                self._bytes -= self._items.pop(key)[1]
+            if size > self.max_bytes:
+                # 한도보다 큰 보고서는 캐시하지 않음
+                return
+            self._items[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, old_size) = self._items.popitem(last=False)
+                self._bytes -= old_size
+
+    def get_or_load(self, data, loader, key=None):
+        # key: 이미 계산한 content_hash(data) (큰 파일을 다시 해시하지 않도록)
+        key = key or content_hash(data)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader(data)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._items),
+                    'bytes': self._bytes, 'max_bytes': self.max_bytes}
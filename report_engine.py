@@ -0,0 +1,170 @@
+import pandas as pd
+from pandas.api.types import is_integer_dtype
+
+from report_cache import frame_nbytes
+from report_io import detect_encoding, is_csv, iter_xlsx_chunks, raw_csv_chunks, read_sample
+from report_schema import apply_schema
+from run_profile import RunProfile
+
+# -----------------------------------------------------------
+# 쿠팡 광고 성과 분석 엔진 (Streamlit 비의존)
+#  - aggregate_report(): 판매가/원가와 무관한 합계 (보고서당 1회, 캐시 대상)
+#  - *_metrics(): 마진 설정에 따라 달라지는 지표 (작은 집계표 위에서 재계산)
+# -----------------------------------------------------------
+PLACEMENT_COLUMNS = ['지면', '노출수', '클릭수', '광고비', '판매수량']
+PRODUCT_COLUMNS = ['상품명', '광고비', '판매수량', '노출수', '클릭수']
+KEYWORD_COLUMNS = ['키워드', '광고비', '판매수량', '클릭수']
+
+
+class ReportAggregates:
+    # 보고서 1개의 지면별/옵션별/키워드별 합계 (옵션·키워드 컬럼이 없으면 None)
+    def __init__(self, placement, product=None, keyword=None):
+        self.placement = placement
+        self.product = product
+        self.keyword = keyword
+
+    def nbytes(self):
+        return sum(frame_nbytes(t) for t in (self.placement, self.product, self.keyword))
+
+
+def _widen(table):
+    # 청크 단위로 줄인 정수형(int8 등)은 합계에도 남으므로 지표 컬럼을 int64/float64로 (판매가 곱셈 오버플로 방지)
+    return table.astype({c: 'int64' if is_integer_dtype(table[c]) else 'float64' for c in table.columns[1:]})
+
+
+def aggregate_report(df, col_qty):
+    placement = df.groupby('광고 노출 지면', observed=True).agg({'노출수': 'sum', '클릭수': 'sum', '광고비': 'sum', col_qty: 'sum'}).reset_index()
+    placement.columns = PLACEMENT_COLUMNS
+    placement = _widen(placement)
+
+    product = None
+    if '광고집행 상품명' in df.columns:
+        product = df.groupby('광고집행 상품명', observed=True).agg({'광고비': 'sum', col_qty: 'sum', '노출수': 'sum', '클릭수': 'sum'}).reset_index()
+        product.columns = PRODUCT_COLUMNS
+        product = _widen(product)
+
+    keyword = None
+    if '키워드' in df.columns:
+        keyword = df.groupby('키워드', observed=True).agg({'광고비': 'sum', col_qty: 'sum', '클릭수': 'sum'}).reset_index()
+        keyword.columns = KEYWORD_COLUMNS
+        keyword = _widen(keyword)
+
+    return ReportAggregates(placement, product, keyword)
+
+
+def _combine(a, b):
+    # 부분 합계표 2개를 첫 컬럼(키) 기준으로 합침
+    if a is None or b is None:
+        return a if b is None else b
+    key = a.columns[0]
+    return _widen(pd.concat([a, b], ignore_index=True).groupby(key, as_index=False, observed=True).sum())
+
+
+def combine_aggregates(a, b):
+    return ReportAggregates(_combine(a.placement, b.placement), _combine(a.product, b.product), _combine(a.keyword, b.keyword))
+
+
+def aggregate_chunks(chunks, col_qty, profile=None):
+    # 청크별 부분 합계를 바로바로 합쳐서 원본 행을 메모리에 쌓지 않음
+    profile = profile or RunProfile()
+    total = None
+    for chunk in chunks:
+        with profile.stage('aggregate'):
+            part = aggregate_report(chunk, col_qty)
+            total = part if total is None else combine_aggregates(total, part)
+    if total is not None:
+        for name in ('placement', 'product', 'keyword'):
+            table = getattr(total, name)
+            if table is not None:
+                profile.shape(f'aggregate.{name}', table)
+    return total
+
+
+def _analyze_csv(source, encoding, profile):
+    with profile.stage('parse'):
+        col_qty, chunks = raw_csv_chunks(source, encoding)
+    if col_qty is None:
+        return None
+    return aggregate_chunks(_tracked(chunks, profile, col_qty), col_qty, profile)
+
+
+def _tracked(chunks, profile, col_qty=None):
+    # 읽은 청크의 행/열 수를 기록하고, col_qty가 있으면 스키마 적용까지 (clean 단계)
+    for chunk in profile.iter_stage('parse', chunks):
+        profile.shape('parse', chunk)
+        if col_qty is not None:
+            with profile.stage('clean'):
+                chunk = apply_schema(chunk, col_qty)
+        yield chunk
+
+
+def analyze_report(file_name, source, xlsx_engine=None, sidecar_dir=None, profile=None):
+    # 보고서(바이트 또는 경로) → ReportAggregates (분석 불가능한 보고서면 None)
+    # profile(RunProfile)을 주면 단계별 소요시간/행 수/인코딩 재시도 등을 기록
+    profile = profile or RunProfile()
+    if is_csv(file_name):
+        with profile.stage('decode'):
+            encoding = detect_encoding(read_sample(source))
+        profile.event('encoding', value=encoding)
+        try:
+            return _analyze_csv(source, encoding, profile)
+        except UnicodeDecodeError as e:
+            # 샘플 이후에서 utf-8이 깨지는 드문 경우만 cp949로 다시 읽음
+            if encoding == 'cp949':
+                raise
+            profile.event('encoding_retry', failed=encoding, retry='cp949', position=e.start)
+            return _analyze_csv(source, 'cp949', profile)
+
+    with profile.stage('parse'):
+        col_qty, chunks = iter_xlsx_chunks(source, xlsx_engine, sidecar_dir=sidecar_dir)
+    if col_qty is None:
+        return None
+    # XLSX는 읽기 단계에서 스키마까지 적용됨
+    return aggregate_chunks(_tracked(chunks, profile), col_qty, profile)
+
+
+# --- 마진 의존 지표 ---
+def unit_margin(unit_price, unit_cost, delivery_fee, coupang_fee_rate):
+    # (수수료 금액, 개당 순마진)
+    total_fee_amount = unit_price * (coupang_fee_rate / 100)
+    net_unit_margin = unit_price - unit_cost - delivery_fee - total_fee_amount
+    return total_fee_amount, net_unit_margin
+
+
+def placement_metrics(placement, unit_price, net_unit_margin):
+    summary = placement.copy()
+    summary['실제매출액'] = summary['판매수량'] * unit_price
+    summary['실제ROAS'] = (summary['실제매출액'] / summary['광고비']).fillna(0)
+    summary['클릭률(CTR)'] = (summary['클릭수'] / summary['노출수']).fillna(0)
+    summary['구매전환율(CVR)'] = (summary['판매수량'] / summary['클릭수']).fillna(0)
+    summary['CPC'] = (summary['광고비'] / summary['클릭수']).fillna(0).astype(int)
+    summary['실질순이익'] = (summary['판매수량'] * net_unit_margin) - summary['광고비']
+    return summary
+
+
+def product_metrics(product, net_unit_margin):
+    prod_agg = product.copy()
+    prod_agg['실질순이익'] = (prod_agg['판매수량'] * net_unit_margin) - prod_agg['광고비']
+    return prod_agg
+
+
+def report_totals(placement, unit_price, net_unit_margin):
+    # KPI 카드 / 운영 제안에 쓰는 전체 합계 지표
+    tot = placement[PLACEMENT_COLUMNS[1:]].sum()
+    total_real_revenue = tot['판매수량'] * unit_price
+    return {
+        '노출수': tot['노출수'],
+        '클릭수': tot['클릭수'],
+        '광고비': tot['광고비'],
+        '판매수량': tot['판매수량'],
+        '실제매출액': total_real_revenue,
+        '실제ROAS': total_real_revenue / tot['광고비'] if tot['광고비'] > 0 else 0,
+        '실질순이익': (tot['판매수량'] * net_unit_margin) - tot['광고비'],
+        '클릭률(CTR)': tot['클릭수'] / tot['노출수'] if tot['노출수'] > 0 else 0,
+        '구매전환율(CVR)': tot['판매수량'] / tot['클릭수'] if tot['클릭수'] > 0 else 0,
+    }
+
+
+def wasted_keywords(keyword):
+    # 판매 0 + 광고비 발생 키워드 (광고비 내림차순)
+    return keyword[(keyword['판매수량'] == 0) & (keyword['광고비'] > 0)].sort_values('광고비', ascending=False)
@@ -0,0 +1,265 @@
+import codecs
+import io
+import os
+import tempfile
+from itertools import chain, islice
+
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from report_cache import content_hash, file_content_hash
+from report_schema import analysis_columns, apply_schema, csv_read_options, find_qty_column
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+# -----------------------------------------------------------
+# 쿠팡 광고 보고서 읽기 + 정제 (Streamlit 비의존)
+#  - source: 업로드 바이트(bytes) 또는 파일 경로(str)
+#  - CSV/XLSX 모두 필요한 컬럼만 청크 단위로 읽어 메모리 사용량을 일정하게 유지
+#  - XLSX 엔진: calamine(설치된 경우) / openpyxl read-only 스트리밍
+#    HOONPRO_XLSX_ENGINE=auto|calamine|openpyxl 로 선택
+#  - HOONPRO_XLSX_SIDECAR_DIR을 지정하면 처음 읽은 XLSX를 Parquet으로 저장해 두고 재사용
+# -----------------------------------------------------------
+CHUNK_ROWS = 200_000
+SAMPLE_BYTES = 64 * 1024
+HEADER_SCAN_ROWS = 20
+
+XLSX_ENGINE = os.environ.get('HOONPRO_XLSX_ENGINE', 'auto')
+XLSX_SIDECAR_DIR = os.environ.get('HOONPRO_XLSX_SIDECAR_DIR') or None
+
+
+def _buffer(source):
+    # 읽을 때마다 처음부터 읽는 새 버퍼 (경로는 그대로 전달)
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def read_sample(source):
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:SAMPLE_BYTES])
+    with open(source, 'rb') as f:
+        return f.read(SAMPLE_BYTES)
+
+
+def detect_encoding(sample):
+    # 앞부분 샘플만 보고 utf-8-sig / cp949 판별 (샘플 끝에서 잘린 멀티바이트 문자는 허용)
+    try:
+        codecs.getincrementaldecoder('utf-8-sig')().decode(sample, final=False)
+        return 'utf-8-sig'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def is_csv(file_name):
+    return str(file_name).lower().endswith('.csv')
+
+
+def read_report(file_name, source):
+    # 보고서 전체를 DataFrame으로 읽음
+    if is_csv(file_name):
+        try:
+            return pd.read_csv(_buffer(source), encoding=detect_encoding(read_sample(source)))
+        except UnicodeDecodeError:
+            return pd.read_csv(_buffer(source), encoding='cp949')
+    return pd.read_excel(_buffer(source), engine='openpyxl')
+
+
+def clean_report(df):
+    # 분석에 쓰는 컬럼만 남기고 정제 → (정제된 df, 판매수량 컬럼명)
+    df.columns = [str(c).strip() for c in df.columns]
+    keep, col_qty = analysis_columns(df.columns)
+    if keep is None:
+        return None, None
+    return apply_schema(df[keep].copy(), col_qty), col_qty
+
+
+def load_report(file_name, source):
+    return clean_report(read_report(file_name, source))
+
+
+def raw_csv_chunks(source, encoding, chunk_rows=CHUNK_ROWS):
+    # CSV를 필요한 컬럼만 chunk_rows 행씩 읽음 (스키마 적용 전) → (판매수량 컬럼명, 청크 iterator)
+    header = pd.read_csv(_buffer(source), encoding=encoding, nrows=0).columns
+    keep, col_qty = analysis_columns([str(c).strip() for c in header])
+    if keep is None:
+        return None, iter(())
+    # 키는 청크마다 타입 추론이 달라지지 않도록 category로 고정
+    return col_qty, pd.read_csv(_buffer(source), encoding=encoding, chunksize=chunk_rows, **csv_read_options(header, keep))
+
+
+# --- XLSX ---
+def _openpyxl_rows(source):
+    # read-only 모드: 셀 객체 모델을 만들지 않고 첫 시트의 값만 행 단위로 읽음
+    import openpyxl
+
+    wb = openpyxl.load_workbook(_buffer(source), read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _calamine_rows(source):
+    # calamine은 빈 셀을 ''로 돌려주므로 openpyxl과 같게 None으로 맞춤
+    src = _buffer(source)
+    if isinstance(src, io.BytesIO):
+        wb = python_calamine.CalamineWorkbook.from_filelike(src)
+    else:
+        wb = python_calamine.CalamineWorkbook.from_path(src)
+    for row in wb.get_sheet_by_index(0).iter_rows():
+        yield [None if v == '' else v for v in row]
+
+
+XLSX_READERS = {'openpyxl': _openpyxl_rows, 'calamine': _calamine_rows}
+
+
+def available_xlsx_engines():
+    return [name for name in XLSX_READERS if name != 'calamine' or python_calamine is not None]
+
+
+def resolve_xlsx_engine(engine=None):
+    engine = engine or XLSX_ENGINE
+    if engine == 'auto':
+        return 'calamine' if python_calamine is not None else 'openpyxl'
+    if engine not in available_xlsx_engines():
+        raise ValueError(f"사용할 수 없는 XLSX 엔진입니다: {engine} (가능: {', '.join(available_xlsx_engines())})")
+    return engine
+
+
+def _cell_names(row):
+    return [str(c).strip() if c is not None else '' for c in row]
+
+
+def detect_header(rows):
+    # 제목/안내 행이 위에 붙은 보고서도 있어서 '광고 노출 지면' + 판매수량 컬럼이 있는 첫 행을 헤더로 사용
+    for i, row in enumerate(rows):
+        if analysis_columns(_cell_names(row))[0] is not None:
+            return i
+    return 0
+
+
+def _batched(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def raw_xlsx_chunks(source, engine=None, chunk_rows=CHUNK_ROWS):
+    # XLSX를 필요한 컬럼만 chunk_rows 행씩 읽음 (스키마 적용 전) → (판매수량 컬럼명, 청크 iterator)
+    rows = XLSX_READERS[resolve_xlsx_engine(engine)](source)
+    head = list(islice(rows, HEADER_SCAN_ROWS))
+    if not head:
+        return None, iter(())
+    idx = detect_header(head)
+    header = _cell_names(head[idx])
+    keep, col_qty = analysis_columns(header)
+    if keep is None:
+        return None, iter(())
+
+    positions = [header.index(c) for c in keep]
+    body = chain(head[idx + 1:], rows)
+
+    def chunks():
+        for batch in _batched(body, chunk_rows):
+            data = [[row[i] if i < len(row) else None for i in positions] for row in batch]
+            yield pd.DataFrame(data, columns=keep)
+
+    return col_qty, chunks()
+
+
+def _read_xlsx_chunks(source, engine, chunk_rows):
+    col_qty, chunks = raw_xlsx_chunks(source, engine, chunk_rows)
+    return col_qty, (apply_schema(chunk, col_qty) for chunk in chunks)
+
+
+def _sidecar_path(source, sidecar_dir):
+    key = content_hash(source) if isinstance(source, (bytes, bytearray)) else file_content_hash(source)
+    return os.path.join(sidecar_dir, f"{key}.parquet")
+
+
+def _sidecar_schema(chunk):
+    # 청크마다 다른 category 값 목록/정수 크기(int8, int16 등)와 상관없이 모든 청크를 같은 스키마로 저장
+    import pyarrow as pa
+
+    fields = []
+    for name, dtype in chunk.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            kind = pa.dictionary(pa.int32(), pa.string())
+        elif is_numeric_dtype(dtype):
+            kind = pa.float64()
+        else:
+            kind = pa.string()
+        fields.append(pa.field(name, kind))
+    return pa.schema(fields)
+
+
+def _write_sidecar(chunks, path, sidecar_dir):
+    # 청크를 그대로 넘겨주면서 고유한 임시 파일에 이어 씀 → 끝까지 읽으면 path로 교체
+    # (동시에 같은 보고서를 읽는 다른 프로세스와 임시 파일이 겹치지 않음, 중간에 멈추면 임시 파일 삭제)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        # pyarrow가 없으면 사이드카 없이 진행
+        yield from chunks
+        return
+
+    os.makedirs(sidecar_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix='.parquet.tmp', dir=sidecar_dir)
+    os.close(fd)
+    writer = None
+    writable = True
+    try:
+        for chunk in chunks:
+            if writable:
+                try:
+                    if writer is None:
+                        schema = _sidecar_schema(chunk)
+                        writer = pq.ParquetWriter(tmp, schema)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                except (pa.ArrowException, TypeError, ValueError):
+                    # 숫자/문자가 섞인 키 등 저장할 수 없는 값이면 사이드카만 건너뜀
+                    writable = False
+            yield chunk
+        if writer is not None:
+            writer.close()
+            writer = None
+            if writable:
+                os.replace(tmp, path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_sidecar(path, chunk_rows):
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    col_qty = find_qty_column(parquet.schema_arrow.names)
+
+    def chunks():
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            yield apply_schema(batch.to_pandas(), col_qty)
+
+    return col_qty, chunks()
+
+
+def iter_xlsx_chunks(source, engine=None, chunk_rows=CHUNK_ROWS, sidecar_dir=None):
+    # XLSX를 필요한 컬럼만 chunk_rows 행씩 정제해서 넘겨줌 → (판매수량 컬럼명, 청크 iterator)
+    # 사이드카는 청크를 끝까지 읽었을 때 저장됨 (저장/재사용 모두 청크 단위라 메모리 사용량 일정)
+    sidecar_dir = sidecar_dir or XLSX_SIDECAR_DIR
+    if not sidecar_dir:
+        return _read_xlsx_chunks(source, engine, chunk_rows)
+
+    path = _sidecar_path(source, sidecar_dir)
+    if os.path.exists(path):
+        return _read_sidecar(path, chunk_rows)
+
+    col_qty, chunks = _read_xlsx_chunks(source, engine, chunk_rows)
+    if col_qty is None:
+        return None, iter(())
+    return col_qty, _write_sidecar(chunks, path, sidecar_dir)
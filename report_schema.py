@@ -0,0 +1,64 @@
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+# -----------------------------------------------------------
+# 쿠팡 광고 보고서 컬럼 스키마 + 타입 변환
+#  - 그룹 키(지면/옵션/키워드)는 category, 숫자 컬럼은 가능한 가장 작은 정수형
+#  - CSV는 읽는 시점에 천단위 쉼표/'-'를 처리해 문자열 변환을 건너뜀
+# -----------------------------------------------------------
+QTY_TARGETS = ['총 판매수량(14일)', '총 판매수량(1일)', '총 판매수량', '전환 판매수량', '판매수량']
+KEY_COLUMNS = ['광고 노출 지면', '광고집행 상품명', '키워드']
+METRIC_COLUMNS = ['노출수', '클릭수', '광고비']
+MISSING_PRODUCT = '미확인'
+
+
+def find_qty_column(columns):
+    return next((c for c in QTY_TARGETS if c in columns), None)
+
+
+def analysis_columns(columns):
+    # 분석에 필요한 컬럼 목록과 판매수량 컬럼명 (분석 불가능한 보고서면 (None, None))
+    col_qty = find_qty_column(columns)
+    if '광고 노출 지면' not in columns or not col_qty:
+        return None, None
+    return [c for c in KEY_COLUMNS + METRIC_COLUMNS + [col_qty] if c in columns], col_qty
+
+
+def csv_read_options(header, keep):
+    # pd.read_csv 인자: 필요한 컬럼만, 키는 category, 숫자는 쉼표/'-'를 파서에서 처리
+    # header는 원본 컬럼명, keep은 공백 제거 후 이름 기준 목록
+    names = {raw: str(raw).strip() for raw in header}
+    return {
+        'usecols': [raw for raw, name in names.items() if name in keep],
+        'dtype': {raw: 'category' for raw, name in names.items() if name in keep and name in KEY_COLUMNS},
+        'na_values': {raw: ['-'] for raw, name in names.items() if name in keep and name not in KEY_COLUMNS},
+        'thousands': ',',
+    }
+
+
+def coerce_numeric(s):
+    # 이미 숫자형이면 문자열 변환 없이 결측만 0으로 채움
+    # 문자열이면 기존 규칙 그대로: 쉼표 제거, 값이 정확히 '-'이면 0, 나머지 변환 실패는 0
+    if not is_numeric_dtype(s):
+        s = pd.to_numeric(s.astype(str).str.replace(',', '', regex=False).replace('-', '0'), errors='coerce')
+    return pd.to_numeric(s.fillna(0), downcast='integer')
+
+
+def encode_key(s, fill_value=None):
+    if fill_value is not None and s.isna().any():
+        if isinstance(s.dtype, pd.CategoricalDtype) and fill_value not in s.cat.categories:
+            s = s.cat.add_categories([fill_value])
+        s = s.fillna(fill_value)
+    return s if isinstance(s.dtype, pd.CategoricalDtype) else s.astype('category')
+
+
+def apply_schema(df, col_qty):
+    # 컬럼명 공백 제거 + 숫자/키 컬럼 타입 정리 (df를 직접 수정)
+    df.columns = [str(c).strip() for c in df.columns]
+    for col in METRIC_COLUMNS + [col_qty]:
+        if col in df.columns:
+            df[col] = coerce_numeric(df[col])
+    for col in KEY_COLUMNS:
+        if col in df.columns:
+            df[col] = encode_key(df[col], MISSING_PRODUCT if col == '광고집행 상품명' else None)
+    return df
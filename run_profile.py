@@ -0,0 +1,192 @@
+import cProfile
+import io
+import json
+import logging
+import pstats
+import sys
+import time
+import tracemalloc
+import traceback
+import uuid
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+# -----------------------------------------------------------
+# 분석 1회(run) 단계별 계측 (Streamlit 비의존)
+#  - 단계별 소요시간/호출 수/행·열 수/데이터 크기, 인코딩 재시도 같은 이벤트, 오류(traceback)
+#  - run마다 JSON 한 줄 로그 (logger 'hoonpro.profile')
+#  - capture=True인 run만 cProfile + tracemalloc (느려지므로 1회성으로만 사용)
+# -----------------------------------------------------------
+LOGGER = logging.getLogger('hoonpro.profile')
+CAPTURE_TOP = 25
+
+
+def configure_logging(path=None):
+    # JSON 로그 출력 위치 (path가 있으면 파일에 이어 쓰기, 없으면 stderr). 여러 번 불러도 한 번만 설정
+    if not LOGGER.handlers:
+        handler = logging.FileHandler(path, encoding='utf-8') if path else logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        LOGGER.addHandler(handler)
+        LOGGER.setLevel(logging.INFO)
+        LOGGER.propagate = False
+    return LOGGER
+
+
+def max_rss_mb():
+    if resource is None:
+        return None
+    # 리눅스는 KB, macOS는 바이트 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 ** 2 if sys.platform == 'darwin' else 1024), 1)
+
+
+class RunProfile:
+    def __init__(self, name='', capture=False):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.capture = capture
+        self.started = time.time()
+        self.stages = {}
+        self.events = []
+        self.error = None
+        self.report = None
+        self._profiler = None
+        self._started_tracing = False
+        self._start = time.perf_counter()
+        self._elapsed = None
+
+    def _stage(self, name):
+        return self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0})
+
+    @contextmanager
+    def stage(self, name):
+        stat = self._stage(name)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stat['seconds'] += time.perf_counter() - start
+            stat['calls'] += 1
+            if tracing:
+                peak = (tracemalloc.get_traced_memory()[1] - base) / 1024 ** 2
+                stat['peak_mb'] = round(max(stat.get('peak_mb', 0), peak), 1)
+
+    def iter_stage(self, name, items):
+        # items를 하나씩 꺼내는 시간(예: 청크 읽기)을 name 단계로 계산
+        items = iter(items)
+        while True:
+            with self.stage(name):
+                item = next(items, None)
+            if item is None:
+                return
+            yield item
+
+    def shape(self, name, df):
+        # 단계를 통과한 행 수(누적, 인코딩 재시도 시 실패한 읽기 포함), 열 수, 데이터 크기(얕은 계산, 최대값)
+        stat = self._stage(name)
+        stat['rows'] = stat.get('rows', 0) + len(df)
+        stat['cols'] = df.shape[1]
+        mb = round(int(df.memory_usage(index=False).sum()) / 1024 ** 2, 1)
+        stat['frame_mb'] = max(stat.get('frame_mb', 0), mb)
+
+    def event(self, kind, **detail):
+        self.events.append({'kind': kind, **detail})
+
+    def fail(self, exc):
+        self.error = {
+            'type': type(exc).__name__,
+            'message': str(exc),
+            'traceback': ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)),
+        }
+
+    def finish(self):
+        if self._elapsed is None:
+            self._elapsed = time.perf_counter() - self._start
+        return self
+
+    @property
+    def total_seconds(self):
+        return self._elapsed if self._elapsed is not None else time.perf_counter() - self._start
+
+    def stage_seconds(self):
+        return {name: round(stat['seconds'], 4) for name, stat in self.stages.items() if stat['calls']}
+
+    def remainder(self, name):
+        # 따로 잰 단계들을 뺀 나머지 시간을 name 단계로 기록 (예: 화면 그리기)
+        stat = self._stage(name)
+        stat['seconds'] = max(0.0, self.total_seconds - sum(self.stage_seconds().values()))
+        stat['calls'] = 1
+
+    def to_dict(self):
+        return {
+            'run_id': self.run_id,
+            'name': self.name,
+            'started': round(self.started, 3),
+            'total_seconds': round(self.total_seconds, 4),
+            'stages': {name: _stage_dict(stat) for name, stat in self.stages.items()},
+            'events': self.events,
+            'max_rss_mb': max_rss_mb(),
+            'captured': self.capture,
+            'error': self.error,
+        }
+
+    def log(self):
+        # 오류가 있으면 ERROR 레벨로
+        self.finish()
+        level = logging.ERROR if self.error else logging.INFO
+        LOGGER.log(level, json.dumps(self.to_dict(), ensure_ascii=False, default=str))
+
+    def start_capture(self):
+        # capture=True일 때만 cProfile/tracemalloc을 켬 (stop_capture()까지)
+        if not self.capture or self._profiler is not None:
+            return
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_capture(self):
+        # 상위 항목을 self.report(문자열)에 저장
+        if self._profiler is None:
+            return
+        self._profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+        self.report = _format_capture(self._profiler, snapshot)
+        self._profiler = None
+
+    @contextmanager
+    def capturing(self):
+        self.start_capture()
+        try:
+            yield
+        finally:
+            self.stop_capture()
+
+
+def _stage_dict(stat):
+    # shape()만 기록된 항목(예: 집계 결과표)은 시간 필드 생략
+    if not stat['calls']:
+        return {k: v for k, v in stat.items() if k not in ('seconds', 'calls')}
+    return {**stat, 'seconds': round(stat['seconds'], 4)}
+
+
+def _format_capture(profiler, snapshot):
+    out = io.StringIO()
+    out.write(f"== cProfile (누적시간 상위 {CAPTURE_TOP}) ==\n")
+    pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(CAPTURE_TOP)
+    out.write(f"\n== tracemalloc (현재 할당 상위 {CAPTURE_TOP}) ==\n")
+    for stat in snapshot.statistics('lineno')[:CAPTURE_TOP]:
+        out.write(f"{stat}\n")
+    return out.getvalue()
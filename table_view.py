@@ -0,0 +1,55 @@
+import math
+
+import streamlit as st
+
+# -----------------------------------------------------------
+# 큰 표 렌더링 도우미
+#  - 정렬/슬라이스는 서버에서, Styler 서식은 현재 페이지 행에만 적용
+#  - 전체 목록은 화면 대신 다운로드(클릭할 때만 생성)로 제공
+#  - 페이지 이동은 fragment 재실행이라 표 하나만 다시 그림
+# -----------------------------------------------------------
+PAGE_SIZE = 50
+
+
+def color_profit(val):
+    return f'color: {"red" if val >= 0 else "blue"}; font-weight: bold;'
+
+
+@st.fragment
+def paged_table(df, key, formats=None, profit_cols=None, page_size=PAGE_SIZE):
+    # df는 이미 정렬된 표. 한 페이지(page_size행)만 브라우저로 보냄
+    total = len(df)
+    n_pages = max(1, math.ceil(total / page_size))
+    page = 1
+    if n_pages > 1:
+        page_key = f"{key}_page"
+        # 보고서가 바뀌어 페이지 수가 줄어든 경우 첫 페이지로
+        if st.session_state.get(page_key, 1) > n_pages:
+            st.session_state[page_key] = 1
+        p1, p2 = st.columns([1, 3])
+        page = p1.number_input("페이지", min_value=1, max_value=n_pages, value=1, key=page_key)
+        p2.caption(f"총 {total:,}행 · {page}/{n_pages:,} 페이지")
+
+    st.dataframe(style_page(df, page, page_size, formats, profit_cols), use_container_width=True)
+
+
+def style_page(df, page=1, page_size=PAGE_SIZE, formats=None, profit_cols=None):
+    # page번째 페이지 행만 잘라서 Styler 적용
+    view = df.iloc[(page - 1) * page_size:page * page_size]
+    styler = view.style
+    if formats:
+        styler = styler.format({c: f for c, f in formats.items() if c in view.columns})
+    if profit_cols:
+        styler = styler.map(color_profit, subset=[c for c in profit_cols if c in view.columns])
+    return styler
+
+
+def download_csv(df, label, file_name, key):
+    # CSV는 버튼을 눌렀을 때만 생성 (엑셀 호환을 위해 utf-8-sig)
+    st.download_button(label, data=lambda: df.to_csv(index=False).encode('utf-8-sig'),
+                       file_name=file_name, mime='text/csv', key=key)
+
+
+def lazy_section(label, key):
+    # 켜기 전에는 내용을 계산/렌더링하지 않는 접이식 영역
+    return st.toggle(label, value=False, key=key)
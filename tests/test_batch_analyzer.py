@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_analyzer import output_names, run_batch  # noqa: E402
+
+REPORT = (
+    "광고 노출 지면,노출수,클릭수,광고비,총 판매수량(1일)\n"
+    "검색 영역,100,10,5000,2\n"
+).encode('utf-8')
+
+
+def test_output_names_keep_same_named_reports_apart():
+    names = output_names(['acc/a/rep.csv', 'acc/b/rep.xlsx', 'acc/b/x.csv', 'acc/b/x.xlsx'])
+    assert names == [os.path.join('a', 'rep'), os.path.join('b', 'rep'), os.path.join('b', 'x.csv'), os.path.join('b', 'x.xlsx')]
+    assert output_names(['acc/a/rep.csv']) == ['rep']
+
+
+def test_same_named_reports_in_different_folders(tmp_path):
+    paths = []
+    for account in ('a', 'b'):
+        (tmp_path / account).mkdir()
+        path = tmp_path / account / 'rep.csv'
+        path.write_bytes(REPORT)
+        paths.append(str(path))
+
+    timing = run_batch(paths, str(tmp_path / 'out'), fmt='csv', workers=1)
+    assert (timing['상태'] == 'ok').all()
+    outputs = [p for row in timing['결과파일'] for p in row.split('; ')]
+    assert len(outputs) == len(set(outputs)) == 2
+    assert all(os.path.exists(p) for p in outputs)
+    assert '결과파일' in pd.read_csv(tmp_path / 'out' / 'timing.csv', encoding='utf-8-sig').columns
+
+
+def test_report_with_placeholder_keywords_only(tmp_path):
+    # 비검색 영역 보고서는 키워드가 '-'뿐
+    path = tmp_path / 'rep.csv'
+    path.write_bytes((
+        "광고 노출 지면,키워드,노출수,클릭수,광고비,총 판매수량(1일)\n"
+        "비검색 영역,-,100,10,5000,0\n"
+    ).encode('utf-8'))
+
+    timing = run_batch([str(path)], str(tmp_path / 'out'), fmt='csv', workers=1)
+    assert timing.loc[0, '상태'] == 'ok'
+    assert os.path.exists(tmp_path / 'out' / 'rep.exclude_tokens.csv')
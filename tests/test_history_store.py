@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import sys
+from contextlib import closing
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history_store import HistoryStore  # noqa: E402
+from report_engine import ReportAggregates  # noqa: E402
+
+
+def aggregates(spend, qty, keywords):
+    placement = pd.DataFrame({'지면': ['검색 영역'], '노출수': [100], '클릭수': [10], '광고비': [spend], '판매수량': [qty]})
+    keyword = pd.DataFrame({'키워드': [k for k, _, _ in keywords], '광고비': [float(s) for _, s, _ in keywords],
+                            '판매수량': [float(q) for _, _, q in keywords], '클릭수': [1.0] * len(keywords)})
+    return ReportAggregates(placement, None, keyword)
+
+
+def test_same_file_is_stored_once(tmp_path):
+    store = HistoryStore(str(tmp_path / 'history.sqlite3'))
+    aggs = aggregates(1000, 1, [('마우스', 1000, 1)])
+    assert store.add_report('hash-a', 'a.csv', '2024-01-01', aggs) is True
+    assert store.add_report('hash-a', 'a-copy.csv', '2024-01-02', aggs) is False
+    assert store.has_report('hash-a')
+    assert len(store.reports()) == 1
+
+
+def test_last_n_window(tmp_path):
+    store = HistoryStore(str(tmp_path / 'history.sqlite3'))
+    # 날짜 순서와 저장 순서를 다르게 해서 보고서일 기준인지 확인
+    store.add_report('h3', 'c.csv', '2024-01-03', aggregates(300, 0, [('무료', 300, 0), ('마우스', 50, 0)]))
+    store.add_report('h1', 'a.csv', '2024-01-01', aggregates(100, 5, [('무료', 100, 0), ('마우스', 100, 2)]))
+    store.add_report('h2', 'b.csv', '2024-01-02', aggregates(200, 0, [('무료', 200, 0)]))
+
+    trend = store.placement_trend(last_n=2)
+    assert trend['보고서일'].tolist() == ['2024-01-02', '2024-01-03']
+    assert trend['광고비'].tolist() == [200, 300]
+    assert len(store.placement_trend()) == 3
+
+    # 전체 기간에는 '마우스'가 팔렸지만 최근 2개 보고서에서는 판매 0
+    assert store.wasted_keywords()['키워드'].tolist() == ['무료']
+    recent = store.wasted_keywords(last_n=2).set_index('키워드')
+    assert recent.loc['무료', '광고비'] == 500
+    assert recent.loc['무료', '보고서수'] == 2
+    assert recent.loc['마우스', '광고비'] == 50
+    assert store.wasted_keywords(last_n=2, limit=1)['키워드'].tolist() == ['무료']
+
+
+def test_delete_report_removes_stats(tmp_path):
+    store = HistoryStore(str(tmp_path / 'history.sqlite3'))
+    store.add_report('h1', 'a.csv', '2024-01-01', aggregates(100, 0, [('무료', 100, 0)]))
+    store.delete_report(int(store.reports()['id'][0]))
+    assert store.reports().empty
+    assert store.wasted_keywords().empty
+
+
+def test_old_database_gets_clicks_column(tmp_path):
+    path = str(tmp_path / 'old.sqlite3')
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.executescript("""
+            CREATE TABLE reports (id INTEGER PRIMARY KEY, file_hash TEXT NOT NULL UNIQUE, file_name TEXT NOT NULL,
+                                  report_date TEXT NOT NULL, added_at TEXT NOT NULL);
+            CREATE TABLE keyword_stats (report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+                                        keyword TEXT NOT NULL, spend REAL, quantity REAL,
+                                        PRIMARY KEY (report_id, keyword)) WITHOUT ROWID;
+            INSERT INTO reports VALUES (1, 'old', 'old.csv', '2024-01-01', '2024-01-01T00:00:00');
+            INSERT INTO keyword_stats VALUES (1, '무료', 10, 0);
+        """)
+
+    store = HistoryStore(path)
+    old = store.keyword_stats(1)
+    assert old.columns.tolist() == ['키워드', '광고비', '판매수량', '클릭수']
+    assert old.loc[0, '클릭수'] == 0
+
+    store.add_report('new', 'new.csv', '2024-01-02', aggregates(5, 0, [('무료 배송', 5, 0)]))
+    new_id = int(store.reports()['id'].max())
+    assert store.keyword_stats(new_id).loc[0, '클릭수'] == 1
+    # 두 번째로 열어도 컬럼을 다시 추가하지 않음
+    HistoryStore(path)
@@ -0,0 +1,112 @@
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from keyword_crawler import KeywordExpander  # noqa: E402
+
+# 로컬 스텁 자동완성 서버: 검색어 → 키워드 목록, FAILURES[검색어]의 상태코드를 차례로 먼저 돌려줌
+TREE = {
+    '마우스': ['마우스 무선', '마우스 패드'],
+    '마우스 무선': ['마우스 패드', '마우스 무선 저소음', '마우스'],
+    '마우스 패드': ['마우스 무선 저소음', '마우스 패드 대형'],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    hits = Counter()
+    failures = {}
+    delay = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)['keyword'][0]
+        with self.lock:
+            self.hits[query] += 1
+            pending = self.failures.get(query)
+            status = pending.pop(0) if pending else 200
+        time.sleep(self.delay)
+        body = json.dumps([{'keyword': kw} for kw in TREE.get(query, [])]).encode('utf-8') if status == 200 else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    StubHandler.hits = Counter()
+    StubHandler.failures = {}
+    StubHandler.delay = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/autoComplete"
+    server.shutdown()
+    server.server_close()
+
+
+def make_expander(url, **kwargs):
+    return KeywordExpander(base_url=url, rate=1000, backoff=0, timeout=5, **kwargs)
+
+
+def test_retries_on_503_and_429(stub_url):
+    StubHandler.failures['마우스'] = [503, 429]
+    expander = make_expander(stub_url, retries=3)
+    assert expander.fetch('마우스') == TREE['마우스']
+    assert StubHandler.hits['마우스'] == 3
+    assert expander.requests_made == 3
+
+
+def test_gives_up_after_retries(stub_url):
+    StubHandler.failures['마우스'] = [503, 503, 503]
+    expander = make_expander(stub_url, retries=1)
+    with pytest.raises(expander._requests.HTTPError):
+        expander.fetch('마우스')
+    assert StubHandler.hits['마우스'] == 2
+
+
+def test_ttl_cache_hit_and_expiry(stub_url, tmp_path):
+    expander = make_expander(stub_url, cache_path=str(tmp_path / 'cache.sqlite3'), ttl=3600)
+    assert expander.fetch('마우스') == TREE['마우스']
+    assert expander.fetch('마우스') == TREE['마우스']
+    assert (StubHandler.hits['마우스'], expander.cache_hits) == (1, 1)
+
+    # TTL이 지난 응답은 다시 요청
+    expander.cache.ttl = -1
+    assert expander.fetch('마우스') == TREE['마우스']
+    assert (StubHandler.hits['마우스'], expander.cache_hits) == (2, 1)
+
+
+def test_expand_dedupes_across_levels(stub_url):
+    expander = make_expander(stub_url, max_workers=4)
+    found, failed = expander.expand('마우스', depth=3, suffixes=[])
+    keywords = [row['키워드'] for row in found]
+    assert failed == []
+    assert len(keywords) == len(set(keywords))
+    assert {row['키워드']: row['단계'] for row in found} == {
+        '마우스 무선': 1, '마우스 패드': 1, '마우스 무선 저소음': 2, '마우스 패드 대형': 2}
+    # 같은 검색어는 단계가 달라도 한 번만 요청
+    assert max(StubHandler.hits.values()) == 1
+    assert expander.requests_made == sum(StubHandler.hits.values())
+
+
+def test_expand_stops_requesting_once_capped(stub_url):
+    # 첫 검색어에서 max_keywords를 채우면 나머지 접미어 검색은 보내지 않음
+    StubHandler.delay = 0.05
+    expander = make_expander(stub_url, max_workers=2)
+    found, failed = expander.expand('마우스', depth=2, suffixes=list('가나다라마바사아자차카타파하'), max_keywords=2)
+    assert [row['키워드'] for row in found] == TREE['마우스']
+    assert sum(StubHandler.hits.values()) <= 4
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import keyword_index  # noqa: E402
+from keyword_index import KeywordIndex, build_index, normalize_keywords  # noqa: E402
+
+TABLE = pd.DataFrame({
+    '키워드': ['로지텍MX 마우스!!', '무료 마우스', '무료 키보드', '로지택 마우스', '로지택 키보드', '무료 배송 마우스'],
+    '광고비': [100.0, 200.0, 300.0, 50.0, 60.0, 70.0],
+    '판매수량': [1.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    '클릭수': [1.0, 2.0, 3.0, 1.0, 1.0, 1.0],
+})
+
+
+def test_normalize_splits_hangul_latin_and_strips_symbols():
+    assert normalize_keywords(pd.Series(['로지텍MX 마우스!!', '1+1 양말'])).tolist() == ['로지텍 mx 마우스', '1+1 양말']
+
+
+def test_candidates_rank_wasted_tokens():
+    found = build_index([TABLE]).candidates()
+    assert found['용어'].tolist() == ['무료', '키보드', '로지택']
+    assert found.loc[0, '판매0광고비'] == 570
+
+
+def test_incremental_add_matches_full_build():
+    step = build_index([TABLE.iloc[:3], TABLE.iloc[2:], TABLE])
+    full = build_index([pd.concat([TABLE.iloc[:3], TABLE.iloc[2:], TABLE])])
+    a = step.term_stats().set_index('용어').sort_index()
+    b = full.term_stats().set_index('용어').sort_index()
+    assert a.index.equals(b.index)
+    assert np.allclose(a.to_numpy(dtype=float), b.to_numpy(dtype=float))
+
+
+def test_vocabulary_overflow_raises_before_changing_index(monkeypatch):
+    monkeypatch.setattr(keyword_index, 'TOKEN_SPACE', 6)
+    index = KeywordIndex().add(TABLE.iloc[:2])
+    before = (len(index), len(index.tokens), len(index.term_keys))
+    with pytest.raises(ValueError):
+        index.add(TABLE)
+    assert (len(index), len(index.tokens), len(index.term_keys)) == before
+
+
+def keyword_table(keywords):
+    n = len(keywords)
+    return pd.DataFrame({'키워드': keywords, '광고비': [10.0] * n, '판매수량': [0.0] * n, '클릭수': [1.0] * n})
+
+
+def test_symbol_only_keywords_have_no_terms():
+    index = build_index([keyword_table(['!!', '??']), keyword_table(['-'])])
+    assert len(index) == 3
+    assert len(index.term_keys) == 0
+    assert index.candidates().empty
+
+
+def test_mixed_symbol_keyword_table():
+    index = build_index([keyword_table(['무료 배송', '-']), keyword_table(['무료 마우스', '-'])])
+    assert len(index) == 3
+    stats = index.term_stats().set_index('용어')
+    assert stats.loc['무료', '키워드수'] == 2
+    assert stats.loc['무료', '광고비'] == 20
+    assert index.candidates()['용어'].tolist() == ['무료']
@@ -0,0 +1,79 @@
+import functools
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import report_engine  # noqa: E402
+import report_io  # noqa: E402
+from report_engine import aggregate_report, analyze_report, placement_metrics, report_totals  # noqa: E402
+from report_io import load_report  # noqa: E402
+from run_profile import RunProfile  # noqa: E402
+
+# 작은 보고서는 청크에서 int8/int16으로 줄어든 타입이 합계표까지 남아 판매가 곱셈이 넘침
+SMALL_REPORT = (
+    "광고 노출 지면,노출수,클릭수,광고비,총 판매수량(1일)\n"
+    "검색 영역,100,10,5000,200\n"
+    "비검색 영역,50,3,800,5\n"
+    "검색 영역,10,1,100,0\n"
+).encode('utf-8')
+
+
+def test_small_report_metrics_do_not_overflow():
+    aggs = analyze_report('small.csv', SMALL_REPORT)
+    summary = placement_metrics(aggs.placement, 10_000, 3_000).set_index('지면')
+    assert summary.loc['검색 영역', '실제매출액'] == 2_000_000
+    assert summary.loc['비검색 영역', '실제매출액'] == 50_000
+    assert (summary['실제ROAS'] > 0).all()
+
+
+def test_small_report_realistic_price():
+    aggs = analyze_report('small.csv', SMALL_REPORT)
+    totals = report_totals(aggs.placement, 19_900, 5_000)
+    assert totals['판매수량'] == 205
+    assert totals['실제ROAS'] > 0
+    assert all(str(t) in ('int64', 'float64') for t in aggs.placement.dtypes.iloc[1:])
+
+
+# 청크(2행)마다 지면/옵션/키워드 값 목록이 달라지고, '-'와 천단위 쉼표가 섞인 보고서
+CHUNKED_REPORT = (
+    "광고 노출 지면,광고집행 상품명,키워드,노출수,클릭수,광고비,총 판매수량(1일)\n"
+    "검색 영역,마우스,무료 마우스,\"1,000\",10,\"5,000\",2\n"
+    "검색 영역,키보드,-,20,-,-,-\n"
+    "비검색 영역,마우스,-,\"30,000\",\"1,200\",\"900,000\",300\n"
+    "리타겟팅,허브,허브,5,1,100,-\n"
+    "검색 영역,이어폰,이어폰,7,0,0,0\n"
+    "비검색 영역,마우스,무선 마우스,8,2,300,1\n"
+    "리타겟팅,허브,-,9,-,-,-\n"
+)
+
+
+def one_shot(data):
+    # 청크 없이 전체를 한 번에 읽어 groupby
+    df, col_qty = load_report('report.csv', data)
+    return aggregate_report(df, col_qty)
+
+
+def sorted_table(table):
+    return table.sort_values(table.columns[0]).reset_index(drop=True)
+
+
+def test_chunked_aggregation_matches_one_shot(monkeypatch):
+    monkeypatch.setattr(report_engine, 'raw_csv_chunks', functools.partial(report_io.raw_csv_chunks, chunk_rows=2))
+    for encoding in ('utf-8-sig', 'cp949'):
+        data = CHUNKED_REPORT.encode(encoding)
+        profile = RunProfile()
+        chunked = analyze_report('report.csv', data, profile=profile)
+        expected = one_shot(data)
+
+        assert profile.events[0] == {'kind': 'encoding', 'value': encoding}
+        assert profile.stages['parse']['rows'] == 7
+        assert profile.stages['aggregate']['calls'] == 4
+        for name in ('placement', 'product', 'keyword'):
+            pd.testing.assert_frame_equal(sorted_table(getattr(chunked, name)), sorted_table(getattr(expected, name)),
+                                          check_dtype=False, check_categorical=False)
+        totals = chunked.placement.set_index('지면')
+        assert totals.loc['비검색 영역', '광고비'] == 900_300
+        assert totals.loc['리타겟팅', '판매수량'] == 0
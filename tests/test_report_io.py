@@ -0,0 +1,80 @@
+import io
+import os
+import sys
+import threading
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from report_engine import aggregate_chunks  # noqa: E402
+from report_io import iter_xlsx_chunks  # noqa: E402
+
+# 청크(2행)마다 키 값 목록과 숫자 크기가 달라지도록 구성
+ROWS = pd.DataFrame({
+    '광고 노출 지면': ['검색 영역', '검색 영역', '비검색 영역', '리타겟팅', '검색 영역', '비검색 영역', '리타겟팅'],
+    '광고집행 상품명': ['마우스', '키보드', '마우스', '허브', '이어폰', '마우스', '허브'],
+    '키워드': ['무료 마우스', '-', '-', '허브', '이어폰', '무선 마우스', '-'],
+    '노출수': [100, 20, 30000, 5, 7, 8, 9],
+    '클릭수': ['10', '-', '1,200', '1', '0', '2', '-'],
+    '광고비': ['5,000', '-', '900,000', '100', '0', '300', '-'],
+    '총 판매수량(1일)': [2, 0, 300, 0, 0, 1, 0],
+})
+
+
+def xlsx_bytes():
+    out = io.BytesIO()
+    ROWS.to_excel(out, index=False, engine='openpyxl')
+    return out.getvalue()
+
+
+def totals(col_qty, chunks):
+    aggs = aggregate_chunks(chunks, col_qty)
+    return {name: getattr(aggs, name).sort_values(getattr(aggs, name).columns[0]).reset_index(drop=True)
+            for name in ('placement', 'product', 'keyword')}
+
+
+def assert_same(a, b):
+    for name in a:
+        pd.testing.assert_frame_equal(a[name], b[name], check_dtype=False, check_categorical=False)
+
+
+def test_sidecar_written_in_chunks_and_reused(tmp_path):
+    data = xlsx_bytes()
+    sidecar = tmp_path / 'sidecar'
+    direct = totals(*iter_xlsx_chunks(data, chunk_rows=2))
+
+    col_qty, chunks = iter_xlsx_chunks(data, chunk_rows=2, sidecar_dir=str(sidecar))
+    assert_same(totals(col_qty, chunks), direct)
+    assert [p.suffix for p in sidecar.iterdir()] == ['.parquet']
+
+    col_qty, chunks = iter_xlsx_chunks(data, chunk_rows=2, sidecar_dir=str(sidecar))
+    assert_same(totals(col_qty, chunks), direct)
+
+
+def test_unfinished_read_leaves_no_sidecar(tmp_path):
+    col_qty, chunks = iter_xlsx_chunks(xlsx_bytes(), chunk_rows=2, sidecar_dir=str(tmp_path))
+    next(chunks)
+    chunks.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_concurrent_first_reads_share_sidecar_dir(tmp_path):
+    data = xlsx_bytes()
+    errors = []
+
+    def read():
+        try:
+            col_qty, chunks = iter_xlsx_chunks(data, chunk_rows=2, sidecar_dir=str(tmp_path))
+            for _ in chunks:
+                pass
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert [p.suffix for p in tmp_path.iterdir()] == ['.parquet']
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from title_batch import diagnose_catalog  # noqa: E402
+from title_maker import MAX_TITLE_LENGTH, TITLE_COLUMNS, clean_join, duplicate_tokens  # noqa: E402
+
+CATALOG = pd.DataFrame([
+    # 띄어쓰기 차이 (라운드 티 / 라운드티)
+    ['훈프로', '남자', '여름', '라운드 티', '오버핏', '라운드티', '3종 세트'],
+    # 대소문자/기호 차이
+    ['Nike', '', '', '반팔티', 'NIKE!', '반팔-티', ''],
+    # 정규화하면 비는 단어, 1+1의 +는 유지
+    ['!!', '??', '', '양말', '1+1', '양말', '1+1'],
+    # 빈 칸/결측, 중복 없음
+    [None, '여성', np.nan, '원피스', '', '', ''],
+    ['', '', '', '', '', '', ''],
+    # 같은 단어 세 번 + 50자 초과
+    ['훈프로', '훈프로', '훈프로', '아주아주아주긴제품명', '아주아주아주긴소구점입니다', '아주아주아주긴제품명둘', '구성품 여러개 세트'],
+], columns=TITLE_COLUMNS)
+
+
+def test_batch_matches_single_title_diagnosis():
+    result = diagnose_catalog(CATALOG)
+    for i, row in CATALOG.iterrows():
+        title = clean_join([str(v) if pd.notna(v) else '' for v in row])
+        assert result.loc[i, '상품명'] == title
+        assert result.loc[i, '글자수'] == len(title)
+        assert result.loc[i, '길이초과'] == (len(title) > MAX_TITLE_LENGTH)
+        assert result.loc[i, '중복단어'] == ', '.join(duplicate_tokens(title)), title
+
+
+def test_expected_duplicates():
+    result = diagnose_catalog(CATALOG)
+    assert result['중복단어'].tolist() == ['라운드티', 'Nike, 반팔티', '양말, 1+1', '', '', '훈프로']
+    assert result['길이초과'].tolist() == [False, False, False, False, False, True]
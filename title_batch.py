@@ -0,0 +1,92 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from report_io import detect_encoding
+from title_maker import TOKEN_STRIP_PATTERN, MAX_TITLE_LENGTH, TITLE_COLUMNS
+
+# -----------------------------------------------------------
+# 상품명 대량 조합 + 진단 (title_maker의 DataFrame 버전)
+#  - 컬럼 단위 문자열 연산으로 조합, 중복 단어 검사는 전체 단어 수에 비례하는 시간
+# -----------------------------------------------------------
+
+
+def _normalize(tokens):
+    # title_maker.normalize_token()의 Series 버전
+    return tokens.str.normalize('NFKC').str.lower().str.replace(TOKEN_STRIP_PATTERN, '', regex=True)
+
+
+def build_titles(catalog):
+    # 카탈로그 DataFrame → 상품명 Series (title_maker.clean_join()과 같은 결과를 컬럼 단위로 계산)
+    title = pd.Series('', index=catalog.index, dtype=object)
+    for col in TITLE_COLUMNS:
+        if col not in catalog.columns:
+            continue
+        part = catalog[col].fillna('').astype(str).str.strip()
+        title = pd.Series(np.where(title == '', part, np.where(part == '', title, title + ' ' + part)), index=catalog.index)
+    return title
+
+
+def find_duplicates(titles):
+    # 상품명 Series → 행별 중복 단어 문자열 (', ' 연결, 없으면 '')
+    # (행 번호, 정규화 단어 번호)를 정수 키 하나로 만들어 중복 여부를 한 번에 판정
+    words = titles.reset_index(drop=True).str.split().explode().dropna()
+    result = pd.Series('', index=titles.index, dtype=object)
+    if words.empty:
+        return result
+
+    # 같은 단어가 여러 행에 반복되므로 고유 단어만 정규화
+    word_ids, vocab = pd.factorize(words)
+    norm_of_word, norm_vocab = pd.factorize(_normalize(pd.Series(vocab, dtype=object)))
+    norm_ids = norm_of_word[word_ids]
+    rows = words.index.to_numpy()
+    keep = norm_vocab[norm_ids] != ''
+    rows, word_ids, norm_ids = rows[keep], word_ids[keep], norm_ids[keep]
+
+    width = len(norm_vocab)
+    keys = rows.astype(np.int64) * width + norm_ids
+
+    # 띄어 쓴 두 단어를 붙인 값이 같은 행의 한 단어와 같으면 그 단어를 한 번 더 등장한 것으로 셈
+    same_row = rows[1:] == rows[:-1]
+    joined = norm_vocab[norm_ids[:-1][same_row]] + norm_vocab[norm_ids[1:][same_row]]
+    pair_ids = pd.Index(norm_vocab).get_indexer(joined)
+    pair_keys = rows[:-1][same_row].astype(np.int64) * width + pair_ids
+    pair_keys = pair_keys[(pair_ids >= 0) & np.isin(pair_keys, keys)]
+
+    occurrences = pd.Series(np.concatenate([keys, pair_keys]))
+    dup_keys = pd.unique(occurrences[occurrences.duplicated(keep=False)])
+    if len(dup_keys) == 0:
+        return result
+
+    # 표시는 행에서 처음 나온 표기로
+    first_word = pd.Series(word_ids, index=keys)
+    first_word = first_word[~first_word.index.duplicated()]
+    dup_words = vocab[first_word.loc[dup_keys].to_numpy()]
+
+    joined = {}
+    for row, word in zip(dup_keys // width, dup_words):
+        joined[row] = f"{joined[row]}, {word}" if row in joined else word
+    found = np.fromiter(joined.keys(), dtype=np.int64, count=len(joined))
+    result.iloc[found] = list(joined.values())
+    return result
+
+
+def diagnose_catalog(catalog):
+    # 상품명/글자수/길이초과/중복단어 컬럼을 붙인 결과표
+    result = catalog.copy()
+    result['상품명'] = build_titles(catalog)
+    result['글자수'] = result['상품명'].str.len()
+    result['길이초과'] = result['글자수'] > MAX_TITLE_LENGTH
+    result['중복단어'] = find_duplicates(result['상품명'])
+    return result
+
+
+def read_catalog(file_name, data):
+    # 업로드한 카탈로그(CSV/XLSX)를 모두 문자열로 읽음
+    if file_name.lower().endswith('.csv'):
+        catalog = pd.read_csv(io.BytesIO(data), encoding=detect_encoding(data[:64 * 1024]), dtype=str, keep_default_na=False)
+    else:
+        catalog = pd.read_excel(io.BytesIO(data), engine='openpyxl', dtype=str).fillna('')
+    catalog.columns = [str(c).strip() for c in catalog.columns]
+    return catalog
@@ -0,0 +1,44 @@
+import re
+import unicodedata
+from collections import Counter
+
+# -----------------------------------------------------------
+# 쿠팡 상품명 조합 + 진단 (Streamlit/pandas 비의존, 대량 모드는 title_batch)
+#  - 공식: 브랜드 + 타겟 + 시즌 + 제품명1 + 소구점 + 제품명2 + 구성
+#  - 중복 판정은 정규화(NFKC, 소문자, 기호 제거) 후 비교, '라운드 티' / '라운드티' 같은 띄어쓰기 차이도 중복으로 봄
+# -----------------------------------------------------------
+TITLE_COLUMNS = ['브랜드', '타겟', '시즌', '제품명1', '소구점', '제품명2', '구성']
+MAX_TITLE_LENGTH = 50
+# 정규화 때 지울 문자 ('1+1'의 +는 유지)
+TOKEN_STRIP_PATTERN = r'[^\w+]'
+
+
+def clean_join(parts):
+    # 빈 값 제거하고 공백으로 연결
+    return " ".join([p.strip() for p in parts if p.strip()])
+
+
+def normalize_token(token):
+    return re.sub(TOKEN_STRIP_PATTERN, '', unicodedata.normalize('NFKC', token).lower())
+
+
+def duplicate_tokens(title):
+    # 상품명 1개의 중복 단어 (처음 나온 표기 기준, 등장 순서)
+    pairs = [(w, normalize_token(w)) for w in title.split()]
+    words = [w for w, n in pairs if n]
+    norms = [n for w, n in pairs if n]
+    counts = Counter(norms)
+    # 붙여 쓴 단어와 띄어 쓴 두 단어가 같은 경우 ('라운드티' / '라운드 티')
+    for a, b in zip(norms, norms[1:]):
+        if a + b in counts:
+            counts[a + b] += 1
+    first = {}
+    for w, n in zip(words, norms):
+        first.setdefault(n, w)
+    return [first[n] for n, c in counts.items() if c > 1]
+
+
+def catalog_template_csv():
+    # 대량 모드 업로드 양식 (엑셀 호환을 위해 utf-8-sig)
+    sample = ['훈프로', '남자', '여름', '반팔티', '오버핏', '라운드티', '3종 세트']
+    return (",".join(TITLE_COLUMNS) + "\n" + ",".join(sample) + "\n").encode('utf-8-sig')